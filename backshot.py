@@ -1,51 +1,112 @@
 # remote_control.py
+import os
 import time
 import sys
-import select
 import termios
 import tty
 import threading
+from enum import IntEnum
+
+import numpy as np
+
 from motor_control import MotorControl
 
+class Cmd(IntEnum):
+    NONE = 0
+    FWD = 1
+    BACK = 2
+    LEFT = 3
+    RIGHT = 4
+    STOP = 5
+    QUIT = 6
+
+# Translate raw characters to commands once, in the keyboard thread
+_CHAR2CMD = [Cmd.NONE] * 128
+_CHAR2CMD[ord('w')] = Cmd.FWD
+_CHAR2CMD[ord('s')] = Cmd.BACK
+_CHAR2CMD[ord('a')] = Cmd.LEFT
+_CHAR2CMD[ord('d')] = Cmd.RIGHT
+_CHAR2CMD[ord('x')] = Cmd.STOP
+_CHAR2CMD[ord('q')] = Cmd.QUIT
+_CHAR2CMD[0x03] = Cmd.QUIT  # Ctrl+C
+for _c in 'wsadxq':
+    _CHAR2CMD[ord(_c.upper())] = _CHAR2CMD[ord(_c)]
+
+# Target (linear, angular) velocities per command
+_TARGETS = {
+    Cmd.FWD: (-4.0, 0.0),
+    Cmd.BACK: (4.0, 0.0),
+    Cmd.LEFT: (0.0, -8.0),
+    Cmd.RIGHT: (0.0, 8.0),
+    Cmd.STOP: (0.0, 0.0),
+}
+
+_CMD_MSG = {
+    Cmd.FWD: "Forward (hold to continue)",
+    Cmd.BACK: "Backward (hold to continue)",
+    Cmd.LEFT: "Left (hold to continue)",
+    Cmd.RIGHT: "Right (hold to continue)",
+    Cmd.STOP: "Manual stop",
+}
+
+_MOVE_CMDS = frozenset((Cmd.FWD, Cmd.BACK, Cmd.LEFT, Cmd.RIGHT))
+
+def _announce(cmd, last, detail=""):
+    """Print a command transition once, only when the command changes"""
+    if cmd != last:
+        print(_CMD_MSG[cmd] + detail)
+
 class KeyboardController:
     def __init__(self):
-        self.current_key = None
-        self.key_pressed = False
+        # Single-slot state: (command, monotonic time of last key). The
+        # tuple is replaced wholesale with one attribute store, which is
+        # atomic under the GIL, so reader and writer need no lock for this
+        # last-write-wins pattern.
+        self._state = (Cmd.NONE, 0.0)
+        self.key_timeout = 0.15  # Treat a key as released if no repeat within this window
         self.running = True
-        self.lock = threading.Lock()
-        
+
     def keyboard_thread(self):
         """Dedicated thread for keyboard input monitoring"""
         # Set terminal to raw mode for this thread
-        old_settings = termios.tcgetattr(sys.stdin)
-        tty.setraw(sys.stdin.fileno())
-        
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        tty.setraw(fd)
+
+        # Block in the kernel instead of polling: VMIN=0/VTIME=1 makes read()
+        # wait up to 0.1s for a key, so the thread sleeps at ~0% CPU when idle
+        # but still wakes often enough to notice shutdown.
+        attrs = termios.tcgetattr(fd)
+        attrs[6][termios.VMIN] = 0
+        attrs[6][termios.VTIME] = 1
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
+
         try:
             while self.running:
-                if select.select([sys.stdin], [], [], 0.01) == ([sys.stdin], [], []):
-                    char = sys.stdin.read(1)
-                    with self.lock:
-                        self.current_key = char.lower()
-                        self.key_pressed = True
-                else:
-                    # No key pressed
-                    with self.lock:
-                        self.key_pressed = False
-                        
-                time.sleep(0.001)  # Very small delay to prevent excessive CPU usage
+                # Drain any burst of buffered keys in one syscall; only the
+                # most recent one matters for hold-to-move control.
+                chars = os.read(fd, 32)
+                if chars:
+                    b = chars[-1]
+                    cmd = _CHAR2CMD[b] if b < 128 else Cmd.NONE
+                    self._state = (cmd, time.monotonic())
         finally:
             # Restore terminal settings
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-    
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
     def get_current_key(self):
-        """Get the currently pressed key (thread-safe)"""
-        with self.lock:
-            return self.current_key if self.key_pressed else None
-    
+        """Get the currently held command (thread-safe)"""
+        # Release events never arrive in raw mode, so a key counts as held
+        # only while the keyboard's typematic repeat keeps refreshing it.
+        cmd, t = self._state
+        if cmd and time.monotonic() - t < self.key_timeout:
+            return cmd
+        return None
+
     def is_key_pressed(self):
         """Check if any key is currently pressed (thread-safe)"""
-        with self.lock:
-            return self.key_pressed
+        cmd, t = self._state
+        return bool(cmd) and time.monotonic() - t < self.key_timeout
     
     def stop(self):
         """Stop the keyboard monitoring thread"""
@@ -66,9 +127,11 @@ def main():
     
     last_command = None
     
-    # Current velocities for smooth transitions
-    current_linear = 0.0
-    current_angular = 0.0
+    # Velocity state lives in preallocated arrays so the smoothing update
+    # below is a single vectorized op with no per-tick temporaries
+    current = np.zeros(2)
+    target = np.zeros(2)
+    _diff = np.empty(2)
     
     # Target velocities
     target_linear = 0.0
@@ -77,62 +140,75 @@ def main():
     # Smoothing factor (0.1 = very smooth, 0.9 = very responsive)
     SMOOTHING = 0.3
     
+    # Bind hot-loop lookups to locals: LOAD_FAST instead of a global/attr
+    # dict lookup on every 5ms tick
+    _sleep = time.sleep
+    _monotonic = time.monotonic
+    _subtract = np.subtract
+    _set_vel = mc.set_linear_angular_velocities
+    _get_cmd = keyboard_ctrl.get_current_key
+    
+    # Absolute-deadline scheduling: target every 5ms tick rather than
+    # sleeping 5ms *between* ticks, so print/log spikes don't accumulate
+    # into drift that the smoothing filter would see as varying dt.
+    PERIOD = 0.005
+    next_tick = _monotonic()
+    
+    # Skip the UART write when the command hasn't meaningfully changed,
+    # but refresh periodically so the motor side never sees us go silent
+    SEND_EPS = 1e-3
+    SEND_REFRESH = 0.1
+    last_sent_lin = None
+    last_sent_ang = 0.0
+    last_sent_t = 0.0
+    
     try:
         while True:
-            cmd = keyboard_ctrl.get_current_key()
+            cmd = _get_cmd()
             
             if cmd:
-                if cmd == 'w':
-                    if last_command != 'w':
-                        print("Forward (hold to continue)")
-                    target_linear = -4.0
-                    target_angular = 0.0
-                    last_command = 'w'
-                elif cmd == 's':
-                    if last_command != 's':
-                        print("Backward (hold to continue)")
-                    target_linear = 4.0
-                    target_angular = 0.0
-                    last_command = 's'
-                elif cmd == 'a':
-                    if last_command != 'a':
-                        print("Left (hold to continue)")
-                    target_linear = 0.0
-                    target_angular = -8.0
-                    last_command = 'a'
-                elif cmd == 'd':
-                    if last_command != 'd':
-                        print("Right (hold to continue)")
-                    target_linear = 0.0
-                    target_angular = 8.0
-                    last_command = 'd'
-                elif cmd == 'x':
-                    print("Manual stop")
-                    target_linear = 0.0
-                    target_angular = 0.0
-                    last_command = 'x'
-                elif cmd == 'q':
+                if cmd == Cmd.QUIT:
                     print("Quitting...")
                     break
-                elif cmd == '\x03':  # Ctrl+C
-                    break
+                # One table lookup replaces the old chain of string compares
+                _announce(cmd, last_command)
+                target_linear, target_angular = _TARGETS[cmd]
+                last_command = cmd
             else:
                 # No key pressed - stop if we were moving
-                if last_command in ['w', 's', 'a', 'd']:
+                if last_command in _MOVE_CMDS:
                     if target_linear != 0.0 or target_angular != 0.0:
                         print("Key released - stopping")
                     target_linear = 0.0
                     target_angular = 0.0
                     last_command = None
             
-            # Smooth velocity transitions
-            current_linear += (target_linear - current_linear) * SMOOTHING
-            current_angular += (target_angular - current_angular) * SMOOTHING
+            # Smooth velocity transitions (vectorized, in place)
+            target[0] = target_linear
+            target[1] = target_angular
+            _subtract(target, current, out=_diff)
+            _diff *= SMOOTHING
+            current += _diff
             
-            # Send motor commands
-            mc.set_linear_angular_velocities(current_linear, current_angular)
+            # Send motor commands (only when changed, or on refresh)
+            now = _monotonic()
+            cur_lin = current[0]
+            cur_ang = current[1]
+            if (last_sent_lin is None
+                    or abs(cur_lin - last_sent_lin) > SEND_EPS
+                    or abs(cur_ang - last_sent_ang) > SEND_EPS
+                    or now - last_sent_t > SEND_REFRESH):
+                _set_vel(cur_lin, cur_ang)
+                last_sent_lin = cur_lin
+                last_sent_ang = cur_ang
+                last_sent_t = now
             
-            time.sleep(0.005)  # 5ms loop for smooth control
+            next_tick += PERIOD
+            delay = next_tick - _monotonic()
+            if delay > 0:
+                _sleep(delay)
+            else:
+                next_tick = _monotonic()  # fell behind, resync
             
     except KeyboardInterrupt:
         print("\nInterrupted by user.")
@@ -1,10 +1,78 @@
 # remote_control.py
+import array
 import time
 import sys
 import pygame
 import threading
+from enum import IntEnum
+
+import numpy as np
+
+# evdev gives direct, blocking access to the kernel input layer on Linux;
+# fall back to pygame/SDL where it isn't available.
+try:
+    import evdev
+    from evdev import ecodes
+except ImportError:
+    evdev = None
+
 from motor_control import MotorControl
 
+# Indices into the analog-state array
+LSX, LSY, RSX, RSY, L2, R2 = range(6)
+
+if evdev is not None:
+    # evdev ABS axis codes -> analog-state indices (DualShock 4 layout)
+    _ABS_MAP = {ecodes.ABS_X: LSX, ecodes.ABS_Y: LSY,
+                ecodes.ABS_RX: RSX, ecodes.ABS_RY: RSY,
+                ecodes.ABS_Z: L2, ecodes.ABS_RZ: R2}
+    # evdev key codes -> the button numbers _determine_command expects
+    _KEY_MAP = {ecodes.BTN_SOUTH: 0, ecodes.BTN_START: 9}
+
+class Cmd(IntEnum):
+    NONE = 0
+    FWD = 1
+    BACK = 2
+    LEFT = 3
+    RIGHT = 4
+    STOP = 5
+    QUIT = 6
+
+_MOVE_CMDS = frozenset((Cmd.FWD, Cmd.BACK, Cmd.LEFT, Cmd.RIGHT))
+
+# Per-command intensity sources in priority order:
+# (analog index, deadzone threshold, linear scale, angular scale)
+_CMD_SOURCES = {
+    Cmd.FWD:   ((R2, 0.05, -4.0, 0.0), (RSY, 0.15, -4.0, 0.0), (LSY, 0.15, -4.0, 0.0)),
+    Cmd.BACK:  ((L2, 0.05, 4.0, 0.0), (RSY, 0.15, 4.0, 0.0), (LSY, 0.15, 4.0, 0.0)),
+    Cmd.LEFT:  ((RSX, 0.15, 0.0, -8.0), (LSX, 0.15, 0.0, -8.0)),
+    Cmd.RIGHT: ((RSX, 0.15, 0.0, 8.0), (LSX, 0.15, 0.0, 8.0)),
+}
+
+_SRC_NAME = {R2: "R2 trigger", L2: "L2 trigger",
+             RSX: "Right stick", RSY: "Right stick",
+             LSX: "Left stick", LSY: "Left stick"}
+
+_CMD_NAME = {Cmd.FWD: "Forward", Cmd.BACK: "Backward",
+             Cmd.LEFT: "Left", Cmd.RIGHT: "Right",
+             Cmd.STOP: "Emergency stop"}
+
+def _announce(cmd, last, detail=""):
+    """Print a command transition once, only when the command changes"""
+    if cmd != last:
+        print(_CMD_NAME[cmd] + detail)
+
+def resolve_targets(cmd, analog):
+    """Pick the first active intensity source for cmd and scale it into
+    target velocities. Returns (linear, angular, source index or None)."""
+    for idx, threshold, lin, ang in _CMD_SOURCES[cmd]:
+        v = abs(analog[idx])
+        if v > threshold:
+            return lin * v, ang * v, idx
+    # No source above its deadzone - fall back to full intensity
+    _, _, lin, ang = _CMD_SOURCES[cmd][0]
+    return lin, ang, None
+
 class ControllerInput:
     def __init__(self):
         self.current_command = None
@@ -12,22 +80,51 @@ class ControllerInput:
         self.running = True
         self.lock = threading.Lock()
         
-        # Controller state
-        self.left_stick_x = 0.0
-        self.left_stick_y = 0.0
-        self.right_stick_x = 0.0
-        self.right_stick_y = 0.0
-        self.l2_trigger = 0.0
-        self.r2_trigger = 0.0
+        # Controller state: one preallocated float array instead of six
+        # attributes, so snapshots are a single contiguous copy. The
+        # _v1/_v2 pair is a seqlock: the writer bumps _v1 before touching
+        # the array and copies it into _v2 after, so readers can snapshot
+        # without taking the lock and just retry on a version mismatch.
+        self._analog = array.array('f', [0.0] * 6)
+        self._v1 = 0
+        self._v2 = 0
         self.buttons = {}
         
         # Initialize pygame
         pygame.init()
         pygame.joystick.init()
         self.controller = None
-        
+        self.evdev_device = None
+
+        # Event-driven input: queue only the joystick events we consume
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.JOYAXISMOTION, pygame.JOYBUTTONDOWN,
+                                  pygame.JOYBUTTONUP, pygame.JOYDEVICEADDED,
+                                  pygame.JOYDEVICEREMOVED])
+
+    def _find_evdev_device(self):
+        """Find a gamepad via the kernel input layer (no SDL involved)"""
+        for path in evdev.list_devices():
+            try:
+                dev = evdev.InputDevice(path)
+            except OSError:
+                continue
+            caps = dev.capabilities()
+            if (ecodes.EV_ABS in caps and ecodes.EV_KEY in caps
+                    and ecodes.BTN_SOUTH in caps[ecodes.EV_KEY]):
+                return dev
+        return None
+
     def find_controller(self):
         """Find and initialize the first available controller"""
+        # Prefer the evdev backend: purely reactive reads, no SDL pumping
+        if evdev is not None:
+            dev = self._find_evdev_device()
+            if dev is not None:
+                self.evdev_device = dev
+                print(f"Controller connected (evdev): {dev.name}")
+                return True
+
         joystick_count = pygame.joystick.get_count()
         
         if joystick_count == 0:
@@ -41,38 +138,79 @@ class ControllerInput:
         print(f"Controller connected: {self.controller.get_name()}")
         return True
         
+    def _evdev_thread(self):
+        """Blocking event loop over the kernel input device"""
+        dev = self.evdev_device
+        # Precompute per-axis normalization from the device's ranges
+        norm = {}
+        for code in _ABS_MAP:
+            try:
+                info = dev.absinfo(code)
+            except OSError:
+                continue
+            center = (info.max + info.min) / 2.0
+            scale = (info.max - info.min) / 2.0 or 1.0
+            norm[code] = (center, scale)
+
+        for ev in dev.read_loop():
+            if not self.running:
+                break
+            if ev.type == ecodes.EV_ABS and ev.code in norm:
+                center, scale = norm[ev.code]
+                value = (ev.value - center) / scale
+                idx = _ABS_MAP[ev.code]
+                if idx >= 4:
+                    # Triggers report -1..1 after normalization; store 0..1
+                    value = (value + 1.0) / 2.0
+                self._v1 += 1
+                self._analog[idx] = value
+                self._v2 = self._v1
+            elif ev.type == ecodes.EV_KEY and ev.code in _KEY_MAP:
+                self.buttons[_KEY_MAP[ev.code]] = bool(ev.value)
+            else:
+                continue
+            command = self._determine_command()
+            with self.lock:
+                self.current_command = command
+
     def controller_thread(self):
         """Dedicated thread for controller input monitoring"""
         try:
+            if self.evdev_device is not None:
+                self._evdev_thread()
+                return
             while self.running:
-                # Process pygame events
-                pygame.event.pump()
-                
-                if self.controller:
-                    with self.lock:
-                        # Read analog sticks
-                        if self.controller.get_numaxes() >= 2:
-                            self.left_stick_x = self.controller.get_axis(0)
-                            self.left_stick_y = self.controller.get_axis(1)
-                        
-                        if self.controller.get_numaxes() >= 4:
-                            self.right_stick_x = self.controller.get_axis(2)
-                            self.right_stick_y = self.controller.get_axis(3)
-                        
-                        # Read triggers (L2 and R2)
-                        if self.controller.get_numaxes() >= 6:
-                            self.l2_trigger = (self.controller.get_axis(4) + 1.0) / 2.0
-                            self.r2_trigger = (self.controller.get_axis(5) + 1.0) / 2.0
-                        
-                        # Read buttons
-                        for i in range(self.controller.get_numbuttons()):
-                            self.buttons[i] = self.controller.get_button(i)
-                        
-                        # Determine current command based on controller input
-                        self.current_command = self._determine_command()
-                        
-                time.sleep(0.01)  # 10ms update rate
-                
+                # Block until SDL has something to deliver (or 10ms passes),
+                # then drain the queue. Only the axes/buttons that actually
+                # changed are touched - idle sticks cost zero reads.
+                event = pygame.event.wait(10)
+                events = pygame.event.get()
+                if event.type != pygame.NOEVENT:
+                    events.insert(0, event)
+
+                if not events or not self.controller:
+                    continue
+
+                self._v1 += 1
+                for ev in events:
+                    if ev.type == pygame.JOYAXISMOTION:
+                        if ev.axis < 4:
+                            self._analog[ev.axis] = ev.value
+                        elif ev.axis < 6:
+                            # Triggers report -1..1; store as 0..1
+                            self._analog[ev.axis] = (ev.value + 1.0) / 2.0
+                    elif ev.type == pygame.JOYBUTTONDOWN:
+                        self.buttons[ev.button] = True
+                    elif ev.type == pygame.JOYBUTTONUP:
+                        self.buttons[ev.button] = False
+                self._v2 = self._v1
+
+                # Determine the command outside the lock, then publish it
+                # with a single assignment.
+                command = self._determine_command()
+                with self.lock:
+                    self.current_command = command
+
         except Exception as e:
             print(f"Controller thread error: {e}")
             self.running = False
@@ -84,35 +222,37 @@ class ControllerInput:
         
         # Check for quit button (Options button)
         if self.buttons.get(9, False):
-            return 'q'
+            return Cmd.QUIT
         
         # Check for emergency stop (X/Cross button)
         if self.buttons.get(0, False):
-            return 'x'
+            return Cmd.STOP
         
+        analog = self._analog
+
         # Check triggers first (highest priority)
-        if self.r2_trigger > TRIGGER_DEADZONE:
+        if analog[R2] > TRIGGER_DEADZONE:
             self.input_active = True
-            return 'w'  # Forward
-        elif self.l2_trigger > TRIGGER_DEADZONE:
+            return Cmd.FWD
+        elif analog[L2] > TRIGGER_DEADZONE:
             self.input_active = True
-            return 's'  # Backward
+            return Cmd.BACK
         
         # Check right stick (medium priority)
-        elif abs(self.right_stick_x) > DEADZONE or abs(self.right_stick_y) > DEADZONE:
+        elif abs(analog[RSX]) > DEADZONE or abs(analog[RSY]) > DEADZONE:
             self.input_active = True
-            if abs(self.right_stick_y) > abs(self.right_stick_x):
-                return 'w' if self.right_stick_y < -DEADZONE else 's'
+            if abs(analog[RSY]) > abs(analog[RSX]):
+                return Cmd.FWD if analog[RSY] < -DEADZONE else Cmd.BACK
             else:
-                return 'd' if self.right_stick_x > DEADZONE else 'a'
+                return Cmd.RIGHT if analog[RSX] > DEADZONE else Cmd.LEFT
         
         # Check left stick (lowest priority)
-        elif abs(self.left_stick_x) > DEADZONE or abs(self.left_stick_y) > DEADZONE:
+        elif abs(analog[LSX]) > DEADZONE or abs(analog[LSY]) > DEADZONE:
             self.input_active = True
-            if abs(self.left_stick_y) > abs(self.left_stick_x):
-                return 'w' if self.left_stick_y < -DEADZONE else 's'
+            if abs(analog[LSY]) > abs(analog[LSX]):
+                return Cmd.FWD if analog[LSY] < -DEADZONE else Cmd.BACK
             else:
-                return 'd' if self.left_stick_x > DEADZONE else 'a'
+                return Cmd.RIGHT if analog[LSX] > DEADZONE else Cmd.LEFT
         
         # No significant input
         else:
@@ -130,20 +270,20 @@ class ControllerInput:
             return self.input_active
     
     def get_analog_values(self):
-        """Get current analog values for proportional control"""
-        with self.lock:
-            return {
-                'left_stick_x': self.left_stick_x,
-                'left_stick_y': self.left_stick_y,
-                'right_stick_x': self.right_stick_x,
-                'right_stick_y': self.right_stick_y,
-                'l2_trigger': self.l2_trigger,
-                'r2_trigger': self.r2_trigger
-            }
+        """Get a snapshot of the analog values for proportional control"""
+        # Lock-free seqlock read: retry if the writer was mid-update.
+        # Attribute loads are GIL-atomic, so no barriers are needed.
+        while True:
+            v2 = self._v2
+            snap = self._analog[:]
+            if self._v1 == v2:
+                return snap
     
     def stop(self):
         """Stop the controller monitoring thread"""
         self.running = False
+        if self.evdev_device:
+            self.evdev_device.close()
         if self.controller:
             self.controller.quit()
         pygame.quit()
@@ -175,9 +315,11 @@ def main():
     
     last_command = None
     
-    # Current velocities for smooth transitions
-    current_linear = 0.0
-    current_angular = 0.0
+    # Velocity state lives in preallocated arrays so the smoothing update
+    # below is a single vectorized op with no per-tick temporaries
+    current = np.zeros(2)
+    target = np.zeros(2)
+    _diff = np.empty(2)
     
     # Target velocities
     target_linear = 0.0
@@ -186,106 +328,86 @@ def main():
     # Smoothing factor (0.1 = very smooth, 0.9 = very responsive)
     SMOOTHING = 0.3
     
+    # Bind hot-loop lookups to locals: LOAD_FAST instead of a global/attr
+    # dict lookup on every 5ms tick
+    _sleep = time.sleep
+    _monotonic = time.monotonic
+    _subtract = np.subtract
+    _set_vel = mc.set_linear_angular_velocities
+    _get_cmd = controller_input.get_current_command
+    _get_analog = controller_input.get_analog_values
+    
+    # Absolute-deadline scheduling: target every 5ms tick rather than
+    # sleeping 5ms *between* ticks, so print/log spikes don't accumulate
+    # into drift that the smoothing filter would see as varying dt.
+    PERIOD = 0.005
+    next_tick = _monotonic()
+    
+    # Skip the UART write when the command hasn't meaningfully changed,
+    # but refresh periodically so the motor side never sees us go silent
+    SEND_EPS = 1e-3
+    SEND_REFRESH = 0.1
+    last_sent_lin = None
+    last_sent_ang = 0.0
+    last_sent_t = 0.0
+    
     try:
         while True:
-            cmd = controller_input.get_current_command()
-            analog_values = controller_input.get_analog_values()
+            cmd = _get_cmd()
+            analog_values = _get_analog()
             
             if cmd:
-                # Get intensity from analog values for proportional control
-                intensity = 1.0  # Default intensity
-                
-                if cmd == 'w':
-                    if analog_values['r2_trigger'] > 0.05:
-                        intensity = analog_values['r2_trigger']
-                        if last_command != 'w':
-                            print(f"Forward (R2 trigger: {intensity:.2f})")
-                    elif abs(analog_values['right_stick_y']) > 0.15:
-                        intensity = abs(analog_values['right_stick_y'])
-                        if last_command != 'w':
-                            print(f"Forward (Right stick: {intensity:.2f})")
-                    elif abs(analog_values['left_stick_y']) > 0.15:
-                        intensity = abs(analog_values['left_stick_y'])
-                    if last_command != 'w':
-                            print(f"Forward (Left stick: {intensity:.2f})")
-                    
-                    target_linear = -4.0 * intensity
-                    target_angular = 0.0
-                    last_command = 'w'
-                    
-                elif cmd == 's':
-                    if analog_values['l2_trigger'] > 0.05:
-                        intensity = analog_values['l2_trigger']
-                        if last_command != 's':
-                            print(f"Backward (L2 trigger: {intensity:.2f})")
-                    elif abs(analog_values['right_stick_y']) > 0.15:
-                        intensity = abs(analog_values['right_stick_y'])
-                        if last_command != 's':
-                            print(f"Backward (Right stick: {intensity:.2f})")
-                    elif abs(analog_values['left_stick_y']) > 0.15:
-                        intensity = abs(analog_values['left_stick_y'])
-                    if last_command != 's':
-                            print(f"Backward (Left stick: {intensity:.2f})")
-                    
-                    target_linear = 4.0 * intensity
-                    target_angular = 0.0
-                    last_command = 's'
-                    
-                elif cmd == 'a':
-                    if abs(analog_values['right_stick_x']) > 0.15:
-                        intensity = abs(analog_values['right_stick_x'])
-                        if last_command != 'a':
-                            print(f"Left (Right stick: {intensity:.2f})")
-                    elif abs(analog_values['left_stick_x']) > 0.15:
-                        intensity = abs(analog_values['left_stick_x'])
-                    if last_command != 'a':
-                            print(f"Left (Left stick: {intensity:.2f})")
-                    
-                    target_linear = 0.0
-                    target_angular = -8.0 * intensity
-                    last_command = 'a'
-                    
-                elif cmd == 'd':
-                    if abs(analog_values['right_stick_x']) > 0.15:
-                        intensity = abs(analog_values['right_stick_x'])
-                        if last_command != 'd':
-                            print(f"Right (Right stick: {intensity:.2f})")
-                    elif abs(analog_values['left_stick_x']) > 0.15:
-                        intensity = abs(analog_values['left_stick_x'])
-                    if last_command != 'd':
-                            print(f"Right (Left stick: {intensity:.2f})")
-                    
-                    target_linear = 0.0
-                    target_angular = 8.0 * intensity
-                    last_command = 'd'
-                    
-                elif cmd == 'x':
-                    print("Emergency stop")
-                    target_linear = 0.0
-                    target_angular = 0.0
-                    last_command = 'x'
-                    
-                elif cmd == 'q':
+                if cmd == Cmd.QUIT:
                     print("Quitting...")
                     break
-                    
+                elif cmd == Cmd.STOP:
+                    _announce(cmd, last_command)
+                    target_linear = 0.0
+                    target_angular = 0.0
+                else:
+                    target_linear, target_angular, src = resolve_targets(cmd, analog_values)
+                    if cmd != last_command:
+                        # Build the detail string only on an actual change
+                        intensity = abs(analog_values[src]) if src is not None else 1.0
+                        _announce(cmd, last_command,
+                                  f" ({_SRC_NAME.get(src, 'default')}: {intensity:.2f})")
+                last_command = cmd
+                
             else:
                 # No input - stop if we were moving
-                if last_command in ['w', 's', 'a', 'd']:
+                if last_command in _MOVE_CMDS:
                     if target_linear != 0.0 or target_angular != 0.0:
                         print("Controls released - stopping")
                     target_linear = 0.0
                     target_angular = 0.0
                     last_command = None
             
-            # Smooth velocity transitions
-            current_linear += (target_linear - current_linear) * SMOOTHING
-            current_angular += (target_angular - current_angular) * SMOOTHING
+            # Smooth velocity transitions (vectorized, in place)
+            target[0] = target_linear
+            target[1] = target_angular
+            _subtract(target, current, out=_diff)
+            _diff *= SMOOTHING
+            current += _diff
             
-            # Send motor commands
-            mc.set_linear_angular_velocities(current_linear, current_angular)
+            # Send motor commands (only when changed, or on refresh)
+            now = _monotonic()
+            cur_lin = current[0]
+            cur_ang = current[1]
+            if (last_sent_lin is None
+                    or abs(cur_lin - last_sent_lin) > SEND_EPS
+                    or abs(cur_ang - last_sent_ang) > SEND_EPS
+                    or now - last_sent_t > SEND_REFRESH):
+                _set_vel(cur_lin, cur_ang)
+                last_sent_lin = cur_lin
+                last_sent_ang = cur_ang
+                last_sent_t = now
             
-            time.sleep(0.005)  # 5ms loop for smooth control
+            next_tick += PERIOD
+            delay = next_tick - _monotonic()
+            if delay > 0:
+                _sleep(delay)
+            else:
+                next_tick = _monotonic()  # fell behind, resync
             
     except KeyboardInterrupt:
         print("\nInterrupted by user.")
@@ -53,52 +53,59 @@ class ControlNode(Node):
         # Initialize controller
         self.controller = MotorControl()
         
-        # Watchdog timer to detect command loss
-        self.last_command_time = time.time()
-        self.command_timeout = 1.0  # Stop robot if no commands for 1 second
+        # Preallocated messages: publish mutates-and-reuses instead of
+        # allocating a fresh Twist (plus nested Vector3s) per callback.
+        # rclpy serializes at publish time, so reuse is safe.
+        self._wheel_msg = Twist()
+        self._zero_msg = Twist()
+        
+        # Watchdog timer to detect command loss. Timed with monotonic_ns:
+        # immune to wall-clock jumps and integer comparisons are cheap.
+        self.last_command_time = time.monotonic_ns()
+        self.command_timeout_ns = 1_000_000_000  # Stop robot if no commands for 1 second
         self.create_timer(0.2, self.watchdog_callback)  # Check for connection loss every 200ms
                 
         self.get_logger().info('Control Node initialized')
-        self.get_logger().info(f'Watchdog timeout set to {self.command_timeout} seconds')
+        self.get_logger().info(f'Watchdog timeout set to {self.command_timeout_ns / 1e9} seconds')
     
     def publish_heartbeat(self):
         """Publish node heartbeat"""
         msg = String()
-        msg.data = f"{self.get_name()}:{time.time()}"
+        now = time.time()  # wall-clock on purpose: consumers compare across hosts
+        msg.data = f"{self.get_name()}:{now}"
         self.node_heartbeat_pub.publish(msg)
         
     def watchdog_callback(self):
         """Check if we've received velocity commands recently, stop robot if not"""
-        time_since_last_command = time.time() - self.last_command_time
+        dt_ns = time.monotonic_ns() - self.last_command_time
         
-        if time_since_last_command > self.command_timeout:
+        if dt_ns > self.command_timeout_ns:
             # No commands received for a while, stop the robot
-            self.get_logger().warn(f'No velocity commands received for {time_since_last_command:.2f} seconds. Stopping robot.')
+            self.get_logger().warn(f'No velocity commands received for {dt_ns / 1e9:.2f} seconds. Stopping robot.')
             self.controller.set_linear_angular_velocities(0.0, 0.0)
             
             # Publish zero wheel velocities for feedback
-            wheel_velocities_msg = Twist()
-            wheel_velocities_msg.linear.x = 0.0  # left wheel
-            wheel_velocities_msg.linear.y = 0.0  # right wheel
-            self.wheel_velocities_pub.publish(wheel_velocities_msg)
+            self.wheel_velocities_pub.publish(self._zero_msg)
     
     def target_velocity_callback(self, msg):
         """Handle target velocity messages."""
         # Update the last command time
-        self.last_command_time = time.time()
+        self.last_command_time = time.monotonic_ns()
         
         self.controller.set_linear_angular_velocities(
             msg.linear.x, 
             msg.angular.z
         )
         # Publish wheel velocities (feedback)
-        l_vel_mps = self.controller.get_left_motor_velocity()
-        r_vel_mps = self.controller.get_right_motor_velocity()
-        wheel_velocities_msg = Twist()
-        wheel_velocities_msg.linear.x = l_vel_mps  # left wheel
-        wheel_velocities_msg.linear.y = r_vel_mps  # right wheel
-        self.wheel_velocities_pub.publish(wheel_velocities_msg)
-        self.get_logger().info(f'Received velocity command: Linear: {msg.linear.x:.3f} m/s, Angular: {msg.angular.z:.3f} rad/s')
+        l_vel_mps, r_vel_mps = self.controller.get_wheel_velocities()
+        self._wheel_msg.linear.x = l_vel_mps  # left wheel
+        self._wheel_msg.linear.y = r_vel_mps  # right wheel
+        self.wheel_velocities_pub.publish(self._wheel_msg)
+        # Throttled: at teleop rates this would otherwise format and log on
+        # every single message
+        self.get_logger().info(
+            f'Received velocity command: Linear: {msg.linear.x:.3f} m/s, Angular: {msg.angular.z:.3f} rad/s',
+            throttle_duration_sec=1.0)
             
     def info(self, msg):
         """Logger compatibility method."""
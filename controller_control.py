@@ -1,31 +1,69 @@
 # controller_control.py
+import array
 import time
 import pygame
 import sys
 import threading
+
+import numpy as np
 from motor_control import MotorControl
 
+# Numba compiles the control kernel to native code when present; without
+# it the pure-Python kernel runs unchanged
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Axis indices into the int16 axis array
+LSX, LSY, RSX, RSY, L2, R2 = range(6)
+
+# Button bit positions in the bitmask (DualShock 4)
+BTN_CROSS = 1 << 0
+BTN_OPTIONS = 1 << 9
+
+class CState:
+    """Pre-allocated controller-state snapshot.
+    A fixed axis array plus one button bitmask instead of dicts, so
+    reading a value is an O(1) load and a snapshot allocates nothing."""
+    __slots__ = ('axes', 'btn_mask')
+
+    def __init__(self):
+        self.axes = array.array('h', bytes(12))
+        self.btn_mask = 0
+
 class ControllerManager:
     def __init__(self):
         self.controller = None
         self.running = True
-        self.lock = threading.Lock()
+        # Seqlock sequence counter: odd while the writer is mid-update,
+        # even when the state is consistent. Int attribute stores are
+        # atomic under the GIL, so no mutex is needed for this
+        # single-producer/single-consumer handoff.
+        self._seq = 0
         
-        # Controller state
-        self.left_stick_x = 0.0
-        self.left_stick_y = 0.0
-        self.right_stick_x = 0.0
-        self.right_stick_y = 0.0
-        self.l2_trigger = 0.0
-        self.r2_trigger = 0.0
+        # Controller state. Axes are quantized to int16 at the event
+        # boundary (Q15: full deflection = +/-32767); the deadzone and
+        # scaling downstream run in fixed point.
+        self.axes = array.array('h', bytes(12))
         
-        # Button states
-        self.buttons = {}
+        # Button states as one int bitmask (bit n = button n): the whole
+        # set is read and written as a single atomic int under the GIL
+        self.btn_mask = 0
+        
+        # Reused snapshot handed out by get_controller_state
+        self._snapshot = CState()
         
         # Initialize pygame
         pygame.init()
         pygame.joystick.init()
         
+        # Event-driven input: queue only the joystick events we consume
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.JOYAXISMOTION, pygame.JOYBUTTONDOWN,
+                                  pygame.JOYBUTTONUP, pygame.JOYHATMOTION,
+                                  pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED])
+        
     def find_controller(self):
         """Find and initialize the first available controller"""
         joystick_count = pygame.joystick.get_count()
@@ -38,9 +76,32 @@ class ControllerManager:
         self.controller = pygame.joystick.Joystick(0)
         self.controller.init()
         
+        # Cache the counts and method bindings once; they don't change
+        # while connected, and the bound references skip pygame's proxy
+        # attribute resolution on every later call
+        self._numaxes = self.controller.get_numaxes()
+        self._numbuttons = self.controller.get_numbuttons()
+        self._get_axis = self.controller.get_axis
+        self._get_button = self.controller.get_button
+        
+        # Seed the state once: events only report changes, so anything held
+        # or deflected before we connected would otherwise read as zero
+        pygame.event.pump()
+        for i in range(min(self._numaxes, 6)):
+            value = self._get_axis(i)
+            if i < 4:
+                self.axes[i] = int(value * 32767)
+            else:
+                self.axes[i] = int((value + 1.0) * 16383.5)
+        mask = 0
+        for i in range(self._numbuttons):
+            if self._get_button(i):
+                mask |= 1 << i
+        self.btn_mask = mask
+        
         print(f"Controller connected: {self.controller.get_name()}")
-        print(f"Number of axes: {self.controller.get_numaxes()}")
-        print(f"Number of buttons: {self.controller.get_numbuttons()}")
+        print(f"Number of axes: {self._numaxes}")
+        print(f"Number of buttons: {self._numbuttons}")
         print(f"Number of hats: {self.controller.get_numhats()}")
         
         return True
@@ -49,48 +110,50 @@ class ControllerManager:
         """Dedicated thread for controller input monitoring"""
         try:
             while self.running:
-                # Process pygame events
-                pygame.event.pump()
+                # Block until SDL delivers an event (or 5ms passes), then
+                # drain the queue; only the axis/button each event names is
+                # refreshed, so idle sticks cost zero reads.
+                event = pygame.event.wait(5)
+                events = pygame.event.get([pygame.JOYAXISMOTION, pygame.JOYBUTTONDOWN,
+                                           pygame.JOYBUTTONUP, pygame.JOYHATMOTION])
+                if event.type != pygame.NOEVENT:
+                    events.insert(0, event)
                 
-                if self.controller:
-                    with self.lock:
-                        # Read analog sticks (normalize from -1.0 to 1.0)
-                        if self.controller.get_numaxes() >= 2:
-                            self.left_stick_x = self.controller.get_axis(0)
-                            self.left_stick_y = self.controller.get_axis(1)
-                        
-                        if self.controller.get_numaxes() >= 4:
-                            self.right_stick_x = self.controller.get_axis(2)
-                            self.right_stick_y = self.controller.get_axis(3)
-                        
-                        # Read triggers (L2 and R2)
-                        if self.controller.get_numaxes() >= 6:
-                            # On DualShock 4, L2 is usually axis 4, R2 is axis 5
-                            self.l2_trigger = (self.controller.get_axis(4) + 1.0) / 2.0  # Convert from -1,1 to 0,1
-                            self.r2_trigger = (self.controller.get_axis(5) + 1.0) / 2.0  # Convert from -1,1 to 0,1
-                        
-                        # Read buttons
-                        for i in range(self.controller.get_numbuttons()):
-                            self.buttons[i] = self.controller.get_button(i)
+                if not events or not self.controller:
+                    continue
                 
-                time.sleep(0.01)  # 10ms update rate
+                s = self._seq + 1
+                self._seq = s  # odd: write in progress
+                for ev in events:
+                    if ev.type == pygame.JOYAXISMOTION:
+                        axis = ev.axis
+                        if axis < 4:
+                            self.axes[axis] = int(ev.value * 32767)
+                        elif axis < 6:
+                            # On DualShock 4, L2 is axis 4, R2 is axis 5;
+                            # convert from -1,1 to 0,32767
+                            self.axes[axis] = int((ev.value + 1.0) * 16383.5)
+                    elif ev.type == pygame.JOYBUTTONDOWN:
+                        self.btn_mask |= 1 << ev.button
+                    elif ev.type == pygame.JOYBUTTONUP:
+                        self.btn_mask &= ~(1 << ev.button)
+                self._seq = s + 1  # even: consistent
                 
         except Exception as e:
             print(f"Controller thread error: {e}")
             self.running = False
     
     def get_controller_state(self):
-        """Get current controller state (thread-safe)"""
-        with self.lock:
-            return {
-                'left_stick_x': self.left_stick_x,
-                'left_stick_y': self.left_stick_y,
-                'right_stick_x': self.right_stick_x,
-                'right_stick_y': self.right_stick_y,
-                'l2_trigger': self.l2_trigger,
-                'r2_trigger': self.r2_trigger,
-                'buttons': self.buttons.copy()
-            }
+        """Get current controller state (lock-free seqlock read)"""
+        snap = self._snapshot
+        while True:
+            s1 = self._seq
+            if s1 & 1:
+                continue  # writer mid-update; retry
+            snap.axes[:] = self.axes
+            snap.btn_mask = self.btn_mask
+            if self._seq == s1:
+                return snap
     
     def stop(self):
         """Stop the controller monitoring"""
@@ -99,15 +162,104 @@ class ControllerManager:
             self.controller.quit()
         pygame.quit()
 
-def apply_deadzone(value, deadzone=0.1):
-    """Apply deadzone to analog stick values"""
-    if abs(value) < deadzone:
-        return 0.0
-    # Scale the remaining range to 0-1
-    if value > 0:
-        return (value - deadzone) / (1.0 - deadzone)
+# Control-mode ids returned by _control_step (MODE_ESTOP is Python-side only)
+MODE_IDLE, MODE_LEFT, MODE_RIGHT, MODE_TRIG_FWD, MODE_TRIG_REV, MODE_ESTOP = range(6)
+
+_INV_FS = 1.0 / 32767.0  # int16 full scale back to 0..1
+
+def _control_step(lx, ly, rx, ry, l2, r2, cl, ca, flx, fly, frx, fry,
+                  smoothing, jitter, max_lin, max_ang, dz16, inv_range_q15, trig16):
+    """One control tick: jitter filter, deadzone, mode priority and EMA.
+
+    Axis inputs are raw int16 readings; the deadzone runs in Q15 fixed
+    point (integer multiply + shift, no division) and values only become
+    floats at the speed-scaling boundary. Scalar arithmetic only, so
+    Numba can compile the whole tick to native code; interpreter overhead
+    dominates this math at 100 Hz otherwise.
+    Returns (new_linear, new_angular, target_linear, target_angular, mode,
+    flx, fly, frx, fry) — the trailing four are the filter state to feed
+    back on the next call.
+    """
+    # One-pole low-pass on the raw sticks: DualShock axes wobble a couple
+    # of LSBs at rest, which MAX_ANGULAR_SPEED would amplify into visible
+    # twitching and which keeps defeating the unchanged-RPM write skip
+    flx += (lx - flx) * jitter
+    fly += (ly - fly) * jitter
+    frx += (rx - frx) * jitter
+    fry += (ry - fry) * jitter
+    lx = int(flx)
+    ly = int(fly)
+    rx = int(frx)
+    ry = int(fry)
+
+    # Scaled-sign deadzone per axis, Q15:
+    # out = (|v| - dz16) * inv_range_q15 >> 15, re-signed, then /32767
+    m = abs(lx) - dz16
+    left_x = 0.0
+    if m > 0:
+        left_x = ((m * inv_range_q15) >> 15) * _INV_FS
+        if lx < 0:
+            left_x = -left_x
+    m = abs(ly) - dz16
+    left_y = 0.0
+    if m > 0:
+        left_y = ((m * inv_range_q15) >> 15) * _INV_FS
+        if ly < 0:
+            left_y = -left_y
+    m = abs(rx) - dz16
+    right_x = 0.0
+    if m > 0:
+        right_x = ((m * inv_range_q15) >> 15) * _INV_FS
+        if rx < 0:
+            right_x = -right_x
+    m = abs(ry) - dz16
+    right_y = 0.0
+    if m > 0:
+        right_y = ((m * inv_range_q15) >> 15) * _INV_FS
+        if ry < 0:
+            right_y = -right_y
+
+    l2 = l2 * _INV_FS if l2 > trig16 else 0.0
+    r2 = r2 * _INV_FS if r2 > trig16 else 0.0
+
+    # Priority: triggers, then right stick, then left stick. The float
+    # comparisons are evaluated once into a 3-bit mask; the selection
+    # below then branches on cheap integer bit tests instead of
+    # re-comparing floats down an elif chain.
+    mask = ((4 if (l2 > 0.0 or r2 > 0.0) else 0)
+            | (2 if (right_x != 0.0 or right_y != 0.0) else 0)
+            | (1 if (left_x != 0.0 or left_y != 0.0) else 0))
+
+    if mask & 4:
+        if l2 > r2:
+            tl = l2 * max_lin  # Reverse
+            ta = 0.0
+            mode = MODE_TRIG_REV
+        else:
+            tl = -r2 * max_lin  # Forward
+            ta = 0.0
+            mode = MODE_TRIG_FWD
+    elif mask & 2:
+        tl = -right_y * max_lin
+        ta = right_x * max_ang
+        mode = MODE_RIGHT
+    elif mask & 1:
+        # Tank-style: Y for forward/back, X for turning
+        tl = -left_y * max_lin
+        ta = left_x * max_ang
+        mode = MODE_LEFT
     else:
-        return (value + deadzone) / (1.0 - deadzone)
+        tl = 0.0
+        ta = 0.0
+        mode = MODE_IDLE
+
+    # Smooth velocity transitions
+    cl += (tl - cl) * smoothing
+    ca += (ta - ca) * smoothing
+    return cl, ca, tl, ta, mode, flx, fly, frx, fry
+
+if njit is not None:
+    _control_step = njit(cache=True, fastmath=True)(_control_step)
 
 def main():
     mc = MotorControl()
@@ -137,106 +289,99 @@ def main():
     # Control variables
     current_linear = 0.0
     current_angular = 0.0
-    target_linear = 0.0
-    target_angular = 0.0
     
     # Smoothing factor (0.1 = very smooth, 0.9 = very responsive)
     SMOOTHING = 0.3
     
+    # Anti-jitter filter coefficient for the raw sticks
+    # (lower = smoother, 1.0 = filter off)
+    JITTER_FILTER = 0.4
+    
+    # Jitter-filter state, in raw int16 axis units
+    flx = fly = frx = fry = 0.0
+    
     # Speed scaling factors
     MAX_LINEAR_SPEED = 4.0
     MAX_ANGULAR_SPEED = 8.0
     
-    # Deadzone for analog sticks
+    # Deadzone for analog sticks, precomputed as Q15 fixed-point constants
     STICK_DEADZONE = 0.15
     TRIGGER_DEADZONE = 0.05
+    _DZ16 = int(STICK_DEADZONE * 32767)
+    _TRIG16 = int(TRIGGER_DEADZONE * 32767)
+    # Maps the post-deadzone range back to full scale without dividing in
+    # the hot path: out = (mag * _INV_RANGE_Q15) >> 15
+    _INV_RANGE_Q15 = (32767 << 15) // (32767 - _DZ16)
+    
+    last_mode = -1
     
-    last_control_mode = None
+    # Phase-locked 100 Hz cadence: advance an absolute deadline instead of
+    # sleeping a fixed 10ms, so scheduling jitter doesn't accumulate into
+    # drift and the loop catches up after a slow iteration.
+    PERIOD = 0.01
+    _perf = time.perf_counter
+    _sleep = time.sleep
+    next_tick = _perf()
     
     try:
         while True:
+            # Sleep first, sample last: waiting at the top of the loop
+            # means the stick state feeding this tick's UART write is
+            # fresh, instead of up to one period old
+            next_tick += PERIOD
+            slack = next_tick - _perf()
+            if slack > 0:
+                _sleep(slack)
+            else:
+                next_tick = _perf()  # fell behind, resync
+            
             state = controller_mgr.get_controller_state()
             
             # Check for quit button (Options button is usually button 9 on DualShock 4)
-            if state['buttons'].get(9, False):  # Options button
+            if state.btn_mask & BTN_OPTIONS:
                 print("Options button pressed - quitting...")
                 break
             
             # Emergency stop (X/Cross button is usually button 0)
-            if state['buttons'].get(0, False):  # X/Cross button
-                if last_control_mode != 'emergency_stop':
+            if state.btn_mask & BTN_CROSS:
+                if last_mode != MODE_ESTOP:
                     print("Emergency stop activated!")
-                target_linear = 0.0
-                target_angular = 0.0
-                last_control_mode = 'emergency_stop'
+                current_linear += (0.0 - current_linear) * SMOOTHING
+                current_angular += (0.0 - current_angular) * SMOOTHING
+                last_mode = MODE_ESTOP
             else:
-                # Apply deadzone to stick inputs
-                left_x = apply_deadzone(state['left_stick_x'], STICK_DEADZONE)
-                left_y = apply_deadzone(-state['left_stick_y'], STICK_DEADZONE)  # Invert Y
-                right_x = apply_deadzone(state['right_stick_x'], STICK_DEADZONE)
-                right_y = apply_deadzone(-state['right_stick_y'], STICK_DEADZONE)  # Invert Y
+                # Whole tick (deadzone, mode priority, smoothing) in one
+                # compiled call; Y axes are inverted at the boundary
+                ax = state.axes
+                (current_linear, current_angular, tl, ta, mode_id,
+                 flx, fly, frx, fry) = _control_step(
+                    ax[LSX], -ax[LSY], ax[RSX], -ax[RSY],
+                    ax[L2], ax[R2],
+                    current_linear, current_angular,
+                    flx, fly, frx, fry,
+                    SMOOTHING, JITTER_FILTER,
+                    MAX_LINEAR_SPEED, MAX_ANGULAR_SPEED,
+                    _DZ16, _INV_RANGE_Q15, _TRIG16)
                 
-                # Apply deadzone to triggers
-                l2 = state['l2_trigger'] if state['l2_trigger'] > TRIGGER_DEADZONE else 0.0
-                r2 = state['r2_trigger'] if state['r2_trigger'] > TRIGGER_DEADZONE else 0.0
-                
-                # Determine control mode based on what's being used
-                control_mode = None
-                
-                # Priority 1: Triggers (simple forward/reverse)
-                if l2 > 0 or r2 > 0:
-                    if l2 > r2:
-                        target_linear = l2 * MAX_LINEAR_SPEED  # Reverse
-                        target_angular = 0.0
-                        control_mode = 'trigger_reverse'
-                    else:
-                        target_linear = -r2 * MAX_LINEAR_SPEED  # Forward
-                        target_angular = 0.0
-                        control_mode = 'trigger_forward'
-                
-                # Priority 2: Right stick (direct linear/angular control)
-                elif abs(right_x) > 0 or abs(right_y) > 0:
-                    target_linear = -right_y * MAX_LINEAR_SPEED
-                    target_angular = right_x * MAX_ANGULAR_SPEED
-                    control_mode = 'right_stick'
-                
-                # Priority 3: Left stick (tank-style control)
-                elif abs(left_x) > 0 or abs(left_y) > 0:
-                    # Tank-style: Y for forward/back, X for turning
-                    target_linear = -left_y * MAX_LINEAR_SPEED
-                    target_angular = left_x * MAX_ANGULAR_SPEED
-                    control_mode = 'left_stick'
-                
-                # No input - stop
-                else:
-                    target_linear = 0.0
-                    target_angular = 0.0
-                    control_mode = 'idle'
-                
-                # Print control mode changes
-                if control_mode != last_control_mode and control_mode != 'idle':
-                    if control_mode == 'trigger_forward':
-                        print(f"Trigger control: Forward ({r2:.2f})")
-                    elif control_mode == 'trigger_reverse':
-                        print(f"Trigger control: Reverse ({l2:.2f})")
-                    elif control_mode == 'right_stick':
-                        print(f"Right stick control: Linear={right_y:.2f}, Angular={right_x:.2f}")
-                    elif control_mode == 'left_stick':
-                        print(f"Left stick control: Linear={left_y:.2f}, Angular={left_x:.2f}")
-                elif control_mode == 'idle' and last_control_mode != 'idle':
+                # Print control mode changes (intensities recovered from the
+                # unsmoothed targets)
+                if mode_id != last_mode and mode_id != MODE_IDLE:
+                    if mode_id == MODE_TRIG_FWD:
+                        print(f"Trigger control: Forward ({-tl / MAX_LINEAR_SPEED:.2f})")
+                    elif mode_id == MODE_TRIG_REV:
+                        print(f"Trigger control: Reverse ({tl / MAX_LINEAR_SPEED:.2f})")
+                    elif mode_id == MODE_RIGHT:
+                        print(f"Right stick control: Linear={-tl / MAX_LINEAR_SPEED:.2f}, Angular={ta / MAX_ANGULAR_SPEED:.2f}")
+                    elif mode_id == MODE_LEFT:
+                        print(f"Left stick control: Linear={-tl / MAX_LINEAR_SPEED:.2f}, Angular={ta / MAX_ANGULAR_SPEED:.2f}")
+                elif mode_id == MODE_IDLE and last_mode != MODE_IDLE:
                     print("Controls released - stopping")
                 
-                last_control_mode = control_mode
-            
-            # Smooth velocity transitions
-            current_linear += (target_linear - current_linear) * SMOOTHING
-            current_angular += (target_angular - current_angular) * SMOOTHING
+                last_mode = mode_id
             
             # Send motor commands
             mc.set_linear_angular_velocities(current_linear, current_angular)
             
-            time.sleep(0.01)  # 10ms control loop
-            
     except KeyboardInterrupt:
         print("\nInterrupted by user.")
     except Exception as e:
@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+import threading
 import time
 import traceback
 import signal
@@ -42,84 +43,155 @@ class MotorControl:
             print(f"Error getting motor directions from JSON file, using constants from config instead: {e}")
             self.left_motor_dir, self.right_motor_dir = CFG.MOTOR_CONTROL_LEFT_MOTOR_DIR, CFG.MOTOR_CONTROL_RIGHT_MOTOR_DIR
 
-        
+        # Hot-path constants, hoisted so the per-cycle command path does
+        # LOAD_FAST reads instead of module-dict lookups
+        self._vmax = CFG.MOTOR_CONTROL_MAX_SPEED_LINEAR_MPS
+        self._wmax = CFG.MOTOR_CONTROL_MAX_SPEED_ANGULAR_RADPS
+        self._half_wheel_base = CFG.ROBOT_WHEEL_DIST_M * 0.5
+        self._inv_rpm_to_mps = 1.0 / RPM_TO_METERS_PER_SECOND
+        self._turns_to_linear_pos = MOTOR_TURNS_TO_LINEAR_POS
+
+        # Dead-band on outgoing commands: skip the UART when neither wheel
+        # RPM moved by more than this since the last send
+        self._rpm_eps = 0.05
+
+        # One reentrant lock serializes every touch of the serial port:
+        # the UART wrapper keeps RX-buffer state across calls and
+        # reset_and_initialize_motors replaces self.motor_controller
+        # outright, so the writer thread, the error poller and direct
+        # callers must never interleave on it.
+        self._port_lock = threading.RLock()
+
         # Initialize motors
         self.reset_and_initialize_motors()
 
         self.cycle_count = 0
 
+        # Background error polling: the synchronous UART round-trip of
+        # has_errors() happens off the control loop, which only reads a
+        # flag. Polling every 500ms instead of every 20th cycle.
+        self._error_flag = False
+        self.running = True
+        self._error_thread = threading.Thread(target=self._error_check_loop, daemon=True)
+        self._error_thread.start()
+
+        # Single-slot command mailbox: the control loop deposits the most
+        # recent (left_rpm, right_rpm) pair and the writer thread sends it.
+        # If commands arrive faster than the UART can take them, stale ones
+        # are overwritten and never transmitted.
+        self._cmd_slot = [None]
+        self._cmd_event = threading.Event()
+        self._cmd_thread = threading.Thread(target=self._uart_writer_loop, daemon=True)
+        self._cmd_thread.start()
+
+    def _uart_writer_loop(self):
+        """Send the latest wheel command from the mailbox to the ODrive."""
+        while self.running:
+            if not self._cmd_event.wait(timeout=0.5):
+                continue
+            self._cmd_event.clear()
+            cmd = self._cmd_slot[0]
+            if cmd is None:
+                continue
+            left_rpm, right_rpm = cmd
+            try:
+                with self._port_lock:
+                    self.motor_controller.set_speed_rpm_both(left_rpm, right_rpm)
+            except Exception as e:
+                print(f'ERROR setting motor speeds: {e}')
+                print("Stopping motors and attempting reset...")
+                self.emergency_stop("Exception while setting motor speeds")
+                self.reset_and_initialize_motors()
+
+    def _error_check_loop(self):
+        """Low-priority poller that checks the ODrive for errors."""
+        while self.running:
+            try:
+                with self._port_lock:
+                    if hasattr(self, 'motor_controller') and self.motor_controller.has_errors():
+                        self._error_flag = True
+            except Exception as e:
+                self.logger.info(f'ERROR checking motor errors: {e}')
+                self._error_flag = True
+            time.sleep(0.5)
+
     def start_motors_velocity_mode(self):
         """Initialize and start motors in velocity mode"""
-        print("Starting motors in velocity mode...")
-        self.motor_controller.start_left()
-        self.motor_controller.start_right()
-        print("Motors started, enabling velocity mode...")
-        self.motor_controller.enable_velocity_mode_left()
-        self.motor_controller.enable_velocity_mode_right()
+        with self._port_lock:
+            print("Starting motors in velocity mode...")
+            self.motor_controller.start_both()
+            print("Motors started, enabling velocity mode...")
+            self.motor_controller.enable_velocity_mode_left()
+            self.motor_controller.enable_velocity_mode_right()
         
-        # Configure for immediate response instead of ramping
-        print("Configuring for maximum acceleration...")
+            # Configure for immediate response instead of ramping
+            print("Configuring for maximum acceleration...")
         
-        # Option 1: Try completely disabling velocity ramping first (most immediate)
-        self.motor_controller.disable_velocity_ramping_left()
-        self.motor_controller.disable_velocity_ramping_right()
+            # Option 1: Try completely disabling velocity ramping first (most immediate)
+            self.motor_controller.disable_velocity_ramping_left()
+            self.motor_controller.disable_velocity_ramping_right()
         
-        # Option 2: If above causes issues, can fall back to high ramp rate
-        # self.motor_controller.config_velocity_ramp_left(1000.0)
-        # self.motor_controller.config_velocity_ramp_right(1000.0)
+            # Option 2: If above causes issues, can fall back to high ramp rate
+            # self.motor_controller.config_velocity_ramp_left(1000.0)
+            # self.motor_controller.config_velocity_ramp_right(1000.0)
         
-        # Increase current limits for more torque during acceleration
-        # Adjust these values based on your motor specifications
-        self.motor_controller.set_current_limit(self.motor_controller.left_axis, 40.0)
-        self.motor_controller.set_current_limit(self.motor_controller.right_axis, 40.0)
+            # Increase current limits for more torque during acceleration
+            # Adjust these values based on your motor specifications
+            self.motor_controller.set_current_limit(self.motor_controller.left_axis, 40.0)
+            self.motor_controller.set_current_limit(self.motor_controller.right_axis, 40.0)
         
-        # Get current ramp rates to verify
-        left_ramp = self.motor_controller.get_velocity_ramp(self.motor_controller.left_axis)
-        right_ramp = self.motor_controller.get_velocity_ramp(self.motor_controller.right_axis)
-        print(f"Velocity ramp rates - Left: {left_ramp}, Right: {right_ramp}")
+            # Get current ramp rates to verify
+            left_ramp = self.motor_controller.get_velocity_ramp(self.motor_controller.left_axis)
+            right_ramp = self.motor_controller.get_velocity_ramp(self.motor_controller.right_axis)
+            print(f"Velocity ramp rates - Left: {left_ramp}, Right: {right_ramp}")
         
-        print("Velocity mode enabled for both motors with max acceleration")
+            print("Velocity mode enabled for both motors with max acceleration")
         
-        # Dump complete motor configuration for verification
-        print("\nDumping complete motor configuration for verification:")
-        self.dump_motor_config()
+            # Dump complete motor configuration for verification
+            print("\nDumping complete motor configuration for verification:")
+            self.dump_motor_config()
 
     def start_motors_torque_mode(self):
         """Initialize and start motors in torque mode"""
-        print("Starting motors in torque mode...")
-        self.motor_controller.start_left()
-        self.motor_controller.start_right()
-        print("Motors started, enabling torque mode...")
-        self.motor_controller.enable_torque_mode_left()
-        self.motor_controller.enable_torque_mode_right()
-        print("Torque mode enabled for both motors")
+        with self._port_lock:
+            print("Starting motors in torque mode...")
+            self.motor_controller.start_both()
+            print("Motors started, enabling torque mode...")
+            self.motor_controller.enable_torque_mode_left()
+            self.motor_controller.enable_torque_mode_right()
+            print("Torque mode enabled for both motors")
 
     def reset_and_initialize_motors(self, torque_mode=False):
         """Reset the ODrive and re-initialize the motors."""
-        print("\n=== Starting motor reset and initialization ===")
-        print(f"Resetting ODrive (torque_mode={torque_mode})...")
-        self.reset_odrive()
-        time.sleep(1)  # Give ODrive time to reset
-        try:
-            print(f"Initializing motor controller on port {CFG.MOTOR_CONTROL_SERIAL_PORT}")
-            print(f"Motor directions - Left: {self.left_motor_dir}, Right: {self.right_motor_dir}")
-            self.motor_controller = ODriveUART(CFG.MOTOR_CONTROL_SERIAL_PORT,
-                                               left_axis=CFG.MOTOR_CONTROL_LEFT_MOTOR_AXIS,
-                                               right_axis=CFG.MOTOR_CONTROL_RIGHT_MOTOR_AXIS,
-                                               dir_left=self.left_motor_dir,
-                                               dir_right=self.right_motor_dir)
-            print("Clearing any existing errors...")
-            self.motor_controller.clear_errors_left()
-            self.motor_controller.clear_errors_right()
-            if torque_mode:
-                self.start_motors_torque_mode()
-            else:
-                self.start_motors_velocity_mode()
-            print("Motors re-initialized successfully.")
-        except Exception as e:
-            print(f"ERROR re-initializing motors: {e}")
-            print("Detailed traceback:")
-            traceback.print_exc()
+        with self._port_lock:
+            # Forget the last-sent command so the first command after a reset
+            # is always transmitted
+            self._last_left = None
+            self._last_right = None
+            print("\n=== Starting motor reset and initialization ===")
+            print(f"Resetting ODrive (torque_mode={torque_mode})...")
+            self.reset_odrive()
+            time.sleep(1)  # Give ODrive time to reset
+            try:
+                print(f"Initializing motor controller on port {CFG.MOTOR_CONTROL_SERIAL_PORT}")
+                print(f"Motor directions - Left: {self.left_motor_dir}, Right: {self.right_motor_dir}")
+                self.motor_controller = ODriveUART(CFG.MOTOR_CONTROL_SERIAL_PORT,
+                                                   left_axis=CFG.MOTOR_CONTROL_LEFT_MOTOR_AXIS,
+                                                   right_axis=CFG.MOTOR_CONTROL_RIGHT_MOTOR_AXIS,
+                                                   dir_left=self.left_motor_dir,
+                                                   dir_right=self.right_motor_dir)
+                print("Clearing any existing errors...")
+                self.motor_controller.clear_errors_left()
+                self.motor_controller.clear_errors_right()
+                if torque_mode:
+                    self.start_motors_torque_mode()
+                else:
+                    self.start_motors_velocity_mode()
+                print("Motors re-initialized successfully.")
+            except Exception as e:
+                print(f"ERROR re-initializing motors: {e}")
+                print("Detailed traceback:")
+                traceback.print_exc()
 
     def reset_odrive(self):
         """
@@ -130,29 +202,43 @@ class MotorControl:
 
     def get_left_motor_velocity(self):
         """Get the current velocity of the left motor."""
-        try:
-            l_pos_m, l_vel_mps = self.motor_controller.get_pos_vel_left()
+        with self._port_lock:
+            try:
+                l_pos_m, l_vel_mps = self.motor_controller.get_pos_vel_left()
 
-            l_vel_mps = l_vel_mps * RPM_TO_METERS_PER_SECOND
+                l_vel_mps = l_vel_mps * RPM_TO_METERS_PER_SECOND
 
-            return l_vel_mps
-        except Exception as e:
-            print('Motor controller error:', e)
-            self.reset_and_initialize_motors()
-            return 0.0
+                return l_vel_mps
+            except Exception as e:
+                print('Motor controller error:', e)
+                self.reset_and_initialize_motors()
+                return 0.0
     
     def get_right_motor_velocity(self):
         """Get the current velocity of the right motor."""
-        try:
-            r_pos_m, r_vel_mps = self.motor_controller.get_pos_vel_right()
+        with self._port_lock:
+            try:
+                r_pos_m, r_vel_mps = self.motor_controller.get_pos_vel_right()
 
-            r_vel_mps = r_vel_mps * RPM_TO_METERS_PER_SECOND
+                r_vel_mps = r_vel_mps * RPM_TO_METERS_PER_SECOND
 
-            return r_vel_mps
-        except Exception as e:
-            print('Motor controller error:', e)
-            self.reset_and_initialize_motors()
-            return 0.0
+                return r_vel_mps
+            except Exception as e:
+                print('Motor controller error:', e)
+                self.reset_and_initialize_motors()
+                return 0.0
+
+    def get_wheel_velocities(self):
+        """Get both wheel velocities in m/s with a single fetch."""
+        with self._port_lock:
+            try:
+                _, l_vel_rpm, _, r_vel_rpm = self.motor_controller.get_pos_vel_both()
+                return (l_vel_rpm * RPM_TO_METERS_PER_SECOND,
+                        r_vel_rpm * RPM_TO_METERS_PER_SECOND)
+            except Exception as e:
+                print('Motor controller error:', e)
+                self.reset_and_initialize_motors()
+                return 0.0, 0.0
 
     def set_linear_angular_velocities(self, velocity_target_mps=0.0, yaw_rate_target_rad_s=0.0):
         """
@@ -175,59 +261,57 @@ class MotorControl:
             #     self.motor_controller.enable_velocity_mode_left()
             #     self.motor_controller.enable_velocity_mode_right()
             if self.is_idle:
-                self.motor_controller.clear_errors_left()
-                self.motor_controller.clear_errors_right()
+                with self._port_lock:
+                    self.motor_controller.clear_errors_left()
+                    self.motor_controller.clear_errors_right()
 
                 self.is_idle = False
 
-            # Motor error checks (every 20 cycles)
-            if self.cycle_count % 20 == 0:
+            # Motor error checks (flag raised by the background poller)
+            if self._error_flag:
+                self._error_flag = False
+                self.logger.info("ERRORS DETECTED in motor controller!")
                 try:
-                    self.logger.info("Performing periodic error check...")
-                    if self.motor_controller.has_errors():
-                        self.logger.info("ERRORS DETECTED in motor controller!")
+                    with self._port_lock:
                         self.motor_controller.dump_errors()
-                        self.logger.info("Attempting motor reset due to errors...")
-                        # First stop the motors before reset
-                        self.emergency_stop("Motor controller errors detected")
-                        self.reset_and_initialize_motors()
-                        return
                 except Exception as e:
-                    self.logger.info(f'ERROR checking motor errors: {e}')
-                    # First stop the motors before reset
-                    self.emergency_stop("Exception during error check")
-                    self.reset_and_initialize_motors()
-                    return
+                    self.logger.info(f'ERROR dumping motor errors: {e}')
+                self.logger.info("Attempting motor reset due to errors...")
+                # First stop the motors before reset
+                self.emergency_stop("Motor controller errors detected")
+                self.reset_and_initialize_motors()
+                return
                 
-            # Clip the desired velocity to the maximum speed
-            velocity_target_mps = max(min(velocity_target_mps, CFG.MOTOR_CONTROL_MAX_SPEED_LINEAR_MPS), -CFG.MOTOR_CONTROL_MAX_SPEED_LINEAR_MPS)
-            yaw_rate_target_rad_s = max(min(yaw_rate_target_rad_s, CFG.MOTOR_CONTROL_MAX_SPEED_ANGULAR_RADPS), -CFG.MOTOR_CONTROL_MAX_SPEED_ANGULAR_RADPS)
-            
-            # Calculate left and right wheel velocities
-            wheel_base_width_m = CFG.ROBOT_WHEEL_DIST_M
+            # Clip the desired velocity to the maximum speed (inline clips
+            # instead of a min/max call pair per value)
+            vmax = self._vmax
+            wmax = self._wmax
+            v = -vmax if velocity_target_mps < -vmax else (vmax if velocity_target_mps > vmax else velocity_target_mps)
+            w = -wmax if yaw_rate_target_rad_s < -wmax else (wmax if yaw_rate_target_rad_s > wmax else yaw_rate_target_rad_s)
             
-            # Apply angular amplification factor to improve turning response
-            angular_component = (wheel_base_width_m * yaw_rate_target_rad_s) / 2
+            # Calculate left and right wheel velocities and convert to RPM
+            angular_component = self._half_wheel_base * w
             
-            left_wheel_velocity = velocity_target_mps - angular_component
-            right_wheel_velocity = velocity_target_mps + angular_component
-
-            # Convert velocities to RPM for motor control
-            left_wheel_rpm = left_wheel_velocity / RPM_TO_METERS_PER_SECOND
-            right_wheel_rpm = right_wheel_velocity / RPM_TO_METERS_PER_SECOND
-
-            # Set motor speeds
-            try:
-                print("Sending commands to motors...")
-                self.motor_controller.set_speed_rpm_left(left_wheel_rpm)
-                self.motor_controller.set_speed_rpm_right(right_wheel_rpm)
-                                
-            except Exception as e:
-                print(f'ERROR setting motor speeds: {e}')
-                print("Stopping motors and attempting reset...")
-                self.emergency_stop("Exception while setting motor speeds")
-                self.reset_and_initialize_motors()
+            left_wheel_rpm = (v - angular_component) * self._inv_rpm_to_mps
+            right_wheel_rpm = (v + angular_component) * self._inv_rpm_to_mps
+
+            # The smoothing upstream produces long runs of near-identical
+            # commands at idle and cruise; don't resend those
+            last_left = self._last_left
+            if (last_left is not None
+                    and abs(left_wheel_rpm - last_left) < self._rpm_eps
+                    and abs(right_wheel_rpm - self._last_right) < self._rpm_eps):
                 return
+            self._last_left = left_wheel_rpm
+            self._last_right = right_wheel_rpm
+
+            # Hand the command to the UART writer thread. The control loop
+            # never blocks on the serial port; the writer always transmits
+            # the newest pair and stale commands are dropped.
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("cmd l=%f r=%f", left_wheel_rpm, right_wheel_rpm)
+            self._cmd_slot[0] = (left_wheel_rpm, right_wheel_rpm)
+            self._cmd_event.set()
 
             self.cycle_count += 1
 
@@ -239,100 +323,106 @@ class MotorControl:
         """
         Emergency stop function to immediately halt all motor movement
         """
-        print(f"EMERGENCY STOP: {reason}")
-        try:
-            # First try the regular stop method which sets velocities to zero
-            self.stop()
-        except Exception as e:
-            print(f"Error during regular stop: {e}, attempting direct motor commands...")
-            # If that fails, try direct commands to motors
+        with self._port_lock:
+            self.logger.error(f"EMERGENCY STOP: {reason}")
             try:
-                if hasattr(self, 'motor_controller'):
-                    self.motor_controller.set_speed_rpm_left(0)
-                    self.motor_controller.set_speed_rpm_right(0)
-                    print("Direct zero velocity commands sent to motors")
-            except Exception as ex:
-                print(f"CRITICAL: Failed to emergency stop motors: {ex}")
-                # Last resort - try to put motors in idle mode
+                # First try the regular stop method which sets velocities to zero
+                self.stop()
+            except Exception as e:
+                print(f"Error during regular stop: {e}, attempting direct motor commands...")
+                # If that fails, try direct commands to motors
                 try:
                     if hasattr(self, 'motor_controller'):
-                        self.motor_controller.set_idle_left()
-                        self.motor_controller.set_idle_right()
-                        print("Motors set to idle state")
-                except:
-                    print("FAILED ALL ATTEMPTS to stop motors")
+                        # force: the zero must go out even if the setpoint
+                        # cache thinks the wheels are already at zero
+                        self.motor_controller.set_speed_rpm_both(0, 0, force=True)
+                        print("Direct zero velocity commands sent to motors")
+                except Exception as ex:
+                    print(f"CRITICAL: Failed to emergency stop motors: {ex}")
+                    # Last resort - try to put motors in idle mode
+                    try:
+                        if hasattr(self, 'motor_controller'):
+                            self.motor_controller.set_idle_both()
+                            print("Motors set to idle state")
+                    except:
+                        print("FAILED ALL ATTEMPTS to stop motors")
 
     def stop(self):
         """
         Stop both motors and set them to idle state for clean shutdown.
         """
-        print("Stopping and idling motors for clean shutdown...")
-        try:
-            # First set velocities to zero
-            self.motor_controller.set_speed_rpm_left(0)
-            self.motor_controller.set_speed_rpm_right(0)
+        with self._port_lock:
+            print("Stopping and idling motors for clean shutdown...")
+            try:
+                # Zero both velocity and torque setpoints in one write
+                # burst (stop_both also invalidates the setpoint cache,
+                # so the next command is always transmitted)
+                self.motor_controller.stop_both()
             
-            # Then put motors in idle state
-            self.motor_controller.set_idle_left()
-            self.motor_controller.set_idle_right()
-            self.is_idle = True
-            print("Motors successfully stopped and set to idle")
-        except Exception as e:
-            print(f"Error stopping motors: {e}")
+                # Then put motors in idle state, again as one burst
+                self.motor_controller.set_idle_both()
+                self.is_idle = True
+                print("Motors successfully stopped and set to idle")
+            except Exception as e:
+                print(f"Error stopping motors: {e}")
 
     def dump_motor_config(self):
         """
         Print out current motor configuration parameters for debugging.
         """
-        print("\n=== ODrive Motor Configuration ===")
-        try:
-            for axis in [self.motor_controller.left_axis, self.motor_controller.right_axis]:
-                name = "LEFT" if axis == self.motor_controller.left_axis else "RIGHT"
-                print(f"\n-- {name} MOTOR (Axis {axis}) --")
+        with self._port_lock:
+            print("\n=== ODrive Motor Configuration ===")
+            try:
+                for axis in [self.motor_controller.left_axis, self.motor_controller.right_axis]:
+                    name = "LEFT" if axis == self.motor_controller.left_axis else "RIGHT"
+                    print(f"\n-- {name} MOTOR (Axis {axis}) --")
                 
-                # Get control mode
-                mode_resp = self.motor_controller.send_command(f'r axis{axis}.controller.config.control_mode')
-                try:
-                    mode = int(mode_resp)
-                    mode_name = "UNKNOWN"
-                    if mode == 0: mode_name = "VOLTAGE"
-                    elif mode == 1: mode_name = "TORQUE"
-                    elif mode == 2: mode_name = "VELOCITY"
-                    elif mode == 3: mode_name = "POSITION"
-                    print(f"Control Mode: {mode} ({mode_name})")
-                except (ValueError, TypeError):
-                    print(f"Control Mode: {mode_resp}")
+                    # Config queries come from the pre-encoded per-axis tables
+                    tmpl = self.motor_controller.cmd_templates[axis]
                 
-                # Get input mode
-                input_mode_resp = self.motor_controller.send_command(f'r axis{axis}.controller.config.input_mode')
-                try:
-                    input_mode = int(input_mode_resp)
-                    input_mode_name = "UNKNOWN"
-                    if input_mode == 1: input_mode_name = "VEL_RAMP"
-                    elif input_mode == 2: input_mode_name = "PASSTHROUGH"
-                    elif input_mode == 3: input_mode_name = "MIX_CHANNELS"
-                    elif input_mode == 4: input_mode_name = "TRAP_TRAJ"
-                    elif input_mode == 5: input_mode_name = "TUNING"
-                    print(f"Input Mode: {input_mode} ({input_mode_name})")
-                except (ValueError, TypeError):
-                    print(f"Input Mode: {input_mode_resp}")
+                    # Get control mode
+                    mode_resp = self.motor_controller.send_command_bytes_with_retry(tmpl['control_mode'])
+                    try:
+                        mode = int(mode_resp)
+                        mode_name = "UNKNOWN"
+                        if mode == 0: mode_name = "VOLTAGE"
+                        elif mode == 1: mode_name = "TORQUE"
+                        elif mode == 2: mode_name = "VELOCITY"
+                        elif mode == 3: mode_name = "POSITION"
+                        print(f"Control Mode: {mode} ({mode_name})")
+                    except (ValueError, TypeError):
+                        print(f"Control Mode: {mode_resp}")
                 
-                # Get velocity ramp rate
-                ramp_rate = self.motor_controller.get_velocity_ramp(axis)
-                print(f"Velocity Ramp Rate: {ramp_rate} rps/s")
+                    # Get input mode
+                    input_mode_resp = self.motor_controller.send_command_bytes_with_retry(tmpl['input_mode'])
+                    try:
+                        input_mode = int(input_mode_resp)
+                        input_mode_name = "UNKNOWN"
+                        if input_mode == 1: input_mode_name = "VEL_RAMP"
+                        elif input_mode == 2: input_mode_name = "PASSTHROUGH"
+                        elif input_mode == 3: input_mode_name = "MIX_CHANNELS"
+                        elif input_mode == 4: input_mode_name = "TRAP_TRAJ"
+                        elif input_mode == 5: input_mode_name = "TUNING"
+                        print(f"Input Mode: {input_mode} ({input_mode_name})")
+                    except (ValueError, TypeError):
+                        print(f"Input Mode: {input_mode_resp}")
                 
-                # Get current limits
-                current_limit = self.motor_controller.send_command(f'r axis{axis}.motor.config.current_lim')
-                print(f"Current Limit: {current_limit} A")
+                    # Get velocity ramp rate
+                    ramp_rate = self.motor_controller.get_velocity_ramp(axis)
+                    print(f"Velocity Ramp Rate: {ramp_rate} rps/s")
                 
-                # Get velocity limit
-                vel_limit = self.motor_controller.send_command(f'r axis{axis}.controller.config.vel_limit')
-                print(f"Velocity Limit: {vel_limit} turns/s")
+                    # Get current limits
+                    current_limit = self.motor_controller.send_command_bytes_with_retry(tmpl['current_lim'])
+                    print(f"Current Limit: {current_limit} A")
                 
-        except Exception as e:
-            print(f"Error getting motor configuration: {e}")
-            traceback.print_exc()
-        print("===================================\n")
+                    # Get velocity limit
+                    vel_limit = self.motor_controller.send_command_bytes_with_retry(tmpl['vel_limit'])
+                    print(f"Velocity Limit: {vel_limit} turns/s")
+                
+            except Exception as e:
+                print(f"Error getting motor configuration: {e}")
+                traceback.print_exc()
+            print("===================================\n")
 
 def stop_motors_on_exit(signal_received, frame):
     print(">>> SIGNAL HANDLER CALLED <<<")
@@ -346,4 +436,17 @@ def stop_motors_on_exit(signal_received, frame):
     sys.exit(0)
 
 signal.signal(signal.SIGINT, stop_motors_on_exit)  # Handle Ctrl+C
-signal.signal(signal.SIGTERM, stop_motors_on_exit) # Handle kill
\ No newline at end of file
+signal.signal(signal.SIGTERM, stop_motors_on_exit) # Handle kill
+
+# Python only runs signal handlers at bytecode boundaries, so a Ctrl+C
+# arriving mid-way through a blocking serial read/write would wait for the
+# UART op to finish. siginterrupt(True) makes those syscalls return EINTR
+# immediately (Python services the handler, then retries per PEP 475), and
+# the wakeup pipe gives any select/poll loop an fd that becomes readable
+# the instant a signal lands.
+_sig_rd, _sig_wr = os.pipe()
+os.set_blocking(_sig_rd, False)
+os.set_blocking(_sig_wr, False)
+signal.set_wakeup_fd(_sig_wr)
+signal.siginterrupt(signal.SIGINT, True)
+signal.siginterrupt(signal.SIGTERM, True)
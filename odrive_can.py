@@ -0,0 +1,208 @@
+# odrive_can.py
+import struct
+import time
+
+import can
+
+import constants as CFG
+
+# CAN-Simple command ids (arbitration_id = (axis_node_id << 5) | cmd_id)
+CMD_HEARTBEAT = 0x001
+CMD_GET_ENCODER_ESTIMATES = 0x009
+CMD_SET_AXIS_STATE = 0x007
+CMD_SET_CONTROLLER_MODE = 0x00B
+CMD_SET_INPUT_VEL = 0x00D
+CMD_CLEAR_ERRORS = 0x018
+
+AXIS_STATE_IDLE = 1
+AXIS_STATE_CLOSED_LOOP_CONTROL = 8
+
+CONTROL_MODE_VELOCITY_CONTROL = 2
+INPUT_MODE_PASSTHROUGH = 2
+
+
+class ODriveCAN:
+    """
+    Interface to an ODrive over CAN-Simple instead of the ASCII UART.
+
+    Commands are single 8-byte frames with hardware arbitration, so both
+    axes can be driven without waiting on a shared half-duplex line. The
+    ODrive broadcasts Get_Encoder_Estimates at its configured rate; a
+    background notifier caches the latest pos/vel per axis, which makes
+    get_pos_vel_* a plain dict read with no bus round-trip at all.
+    """
+
+    def __init__(self, channel='can0', bitrate=1000000,
+                 left_axis=1, right_axis=0, dir_left=1, dir_right=1):
+        """
+        Initialize the ODriveCAN class with the specified parameters.
+        """
+        self.bus = can.interface.Bus(channel=channel, bustype='socketcan',
+                                     bitrate=bitrate)
+        self.left_axis = left_axis
+        self.right_axis = right_axis
+        self.dir_left = dir_left
+        self.dir_right = dir_right
+
+        # Latest broadcast encoder estimates per axis: (pos_turns, vel_rps)
+        self._latest = {left_axis: (0.0, 0.0), right_axis: (0.0, 0.0)}
+        self._latest_time = {left_axis: 0.0, right_axis: 0.0}
+
+        self._notifier = can.Notifier(self.bus, [self._on_message])
+
+    def _on_message(self, msg):
+        """Cache encoder broadcasts; everything else is ignored here."""
+        cmd_id = msg.arbitration_id & 0x1F
+        if cmd_id != CMD_GET_ENCODER_ESTIMATES:
+            return
+        axis = msg.arbitration_id >> 5
+        if axis in self._latest:
+            self._latest[axis] = struct.unpack('<ff', msg.data)
+            self._latest_time[axis] = time.monotonic()
+
+    def _send(self, axis, cmd_id, data=b''):
+        """Send one CAN-Simple frame to the given axis."""
+        self.bus.send(can.Message(arbitration_id=(axis << 5) | cmd_id,
+                                  data=data, is_extended_id=False))
+
+    def enable_velocity_mode(self, axis):
+        """
+        Enable velocity control mode for the specified axis.
+        """
+        self._send(axis, CMD_SET_CONTROLLER_MODE,
+                   struct.pack('<II', CONTROL_MODE_VELOCITY_CONTROL,
+                               INPUT_MODE_PASSTHROUGH))
+
+    def start(self, axis):
+        """
+        Start the specified axis (closed-loop control).
+        """
+        self._send(axis, CMD_SET_AXIS_STATE,
+                   struct.pack('<I', AXIS_STATE_CLOSED_LOOP_CONTROL))
+
+    def set_idle(self, axis):
+        """
+        Set the specified axis to idle mode.
+        """
+        self._send(axis, CMD_SET_AXIS_STATE, struct.pack('<I', AXIS_STATE_IDLE))
+
+    def clear_errors(self, axis):
+        """
+        Clear errors on the specified axis.
+        """
+        self._send(axis, CMD_CLEAR_ERRORS)
+
+    def set_speed_rpm(self, axis, rpm, direction):
+        """
+        Set the speed in RPM for the specified axis: one Set_Input_Vel
+        frame carrying the rps setpoint and zero torque feedforward.
+        """
+        rps = rpm / 60 * direction
+        self._send(axis, CMD_SET_INPUT_VEL, struct.pack('<ff', rps, 0.0))
+
+    def set_speed_rpm_left(self, rpm):
+        """
+        Set the speed in RPM for the left axis.
+        """
+        self.set_speed_rpm(self.left_axis, rpm, self.dir_left)
+
+    def set_speed_rpm_right(self, rpm):
+        """
+        Set the speed in RPM for the right axis.
+        """
+        self.set_speed_rpm(self.right_axis, rpm, self.dir_right)
+
+    def set_speed_rpm_both(self, left_rpm, right_rpm):
+        """
+        Set the speed in RPM for both axes (two frames, arbitrated in
+        hardware — no shared-line turnaround to wait for).
+        """
+        self.set_speed_rpm(self.left_axis, left_rpm, self.dir_left)
+        self.set_speed_rpm(self.right_axis, right_rpm, self.dir_right)
+
+    def get_pos_vel(self, axis, direction):
+        """
+        Get the position and velocity for the specified axis from the
+        cached broadcasts — no bus round-trip.
+        """
+        pos, vel = self._latest[axis]
+        return pos * direction, vel * direction * 60
+
+    def get_pos_vel_left(self):
+        """
+        Get the position and velocity for the left axis.
+        """
+        return self.get_pos_vel(self.left_axis, self.dir_left)
+
+    def get_pos_vel_right(self):
+        """
+        Get the position and velocity for the right axis.
+        """
+        return self.get_pos_vel(self.right_axis, self.dir_right)
+
+    def get_pos_vel_both(self):
+        """
+        Get position and velocity for both axes.
+
+        Returns (left_pos, left_vel_rpm, right_pos, right_vel_rpm).
+        """
+        left_pos, left_vel = self.get_pos_vel(self.left_axis, self.dir_left)
+        right_pos, right_vel = self.get_pos_vel(self.right_axis, self.dir_right)
+        return left_pos, left_vel, right_pos, right_vel
+
+    def estimate_age(self, axis):
+        """
+        Seconds since the last encoder broadcast from the given axis.
+        """
+        return time.monotonic() - self._latest_time[axis]
+
+    def stop(self, axis):
+        """
+        Stop the specified axis.
+        """
+        self._send(axis, CMD_SET_INPUT_VEL, struct.pack('<ff', 0.0, 0.0))
+
+    def stop_left(self):
+        """
+        Stop the left axis.
+        """
+        self.stop(self.left_axis)
+
+    def stop_right(self):
+        """
+        Stop the right axis.
+        """
+        self.stop(self.right_axis)
+
+    def close(self):
+        """
+        Shut down the notifier and the CAN bus.
+        """
+        self._notifier.stop()
+        self.bus.shutdown()
+
+
+if __name__ == '__main__':
+    motor_controller = ODriveCAN(left_axis=0, right_axis=1,
+                                 dir_left=1, dir_right=-1)
+    try:
+        motor_controller.enable_velocity_mode(0)
+        motor_controller.enable_velocity_mode(1)
+        motor_controller.start(0)
+        motor_controller.start(1)
+
+        print("Testing velocity control over CAN...")
+        for speed in [0.5, 1.0, 2.0, 0.0, -1.0, 0.0]:
+            print(f"Setting speed to {speed} RPS...")
+            motor_controller.set_speed_rpm_both(speed * 60, speed * 60)
+            time.sleep(2)
+            print(f"Estimates: {motor_controller.get_pos_vel_both()}")
+    except Exception as e:
+        print(e)
+    finally:
+        print("Shutting down motors...")
+        motor_controller.stop_left()
+        motor_controller.stop_right()
+        motor_controller.set_idle(0)
+        motor_controller.set_idle(1)
+        motor_controller.close()
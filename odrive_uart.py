@@ -1,13 +1,46 @@
+import math
+import os
+import re
+import struct
 import time
 
 import odrive.enums
 import serial
-print(serial.__file__)
-print(serial.__version__)
 # from RPi import GPIO  # Import GPIO module
 
 import constants as CFG
 
+# First (possibly signed) integer in an ODrive response; one C-level regex
+# scan instead of filtering the string character by character in Python
+_NUM = re.compile(r'-?\d+')
+
+def _crc8(data, crc=0x42):
+    """
+    ODrive stream CRC8 (polynomial 0x37, init 0x42).
+    """
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            if crc & 0x80:
+                crc = ((crc << 1) ^ 0x37) & 0xFF
+            else:
+                crc = (crc << 1) & 0xFF
+    return crc
+
+def _crc16(data, crc=0x1337):
+    """
+    ODrive packet CRC16 (polynomial 0x3d65, init 0x1337 unless seeded with
+    the firmware's endpoint-JSON CRC).
+    """
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(8):
+            if crc & 0x8000:
+                crc = ((crc << 1) ^ 0x3d65) & 0xFFFF
+            else:
+                crc = (crc << 1) & 0xFFFF
+    return crc
+
 # GPIO setup for resetting ODrive
 # GPIO.setmode(GPIO.BCM)
 # GPIO.setup(5, GPIO.OUT)
@@ -20,38 +53,325 @@ class ODriveUART:
     AXIS_STATE_CLOSED_LOOP_CONTROL = 8
     ERROR_DICT = {k: v for k, v in odrive.enums.__dict__.items() if k.startswith("AXIS_ERROR_")}
 
-    def __init__(self, port='/dev/ttyACM0', left_axis=1, right_axis=0, dir_left=1, dir_right=1):
+    # Error-name tables per component, built once at class load instead of
+    # rescanning the whole odrive.enums namespace for every error source
+    # dump_errors looks at
+    _PREFIX_TABLES = {
+        p: {n: v for n, v in vars(odrive.enums).items() if n.startswith(p + '_ERROR_')}
+        for p in ('AXIS', 'ENCODER', 'CONTROLLER', 'MOTOR')
+    }
+
+    def __init__(self, port='/dev/ttyACM0', left_axis=1, right_axis=0, dir_left=1, dir_right=1,
+                 baudrate=921600):
         """
         Initialize the ODriveUART class with the specified parameters.
         """
         self.bus = serial.Serial(
             port=port,
-            baudrate=115200,
+            baudrate=baudrate,
             parity=serial.PARITY_NONE,
             stopbits=serial.STOPBITS_ONE,
             bytesize=serial.EIGHTBITS,
-            timeout=1
+            # The ODrive answers in ~1-2ms; a short timeout bounds the
+            # stall from a dropped response at 50ms instead of a second
+            timeout=0.05
         )
         self.left_axis = left_axis
         self.right_axis = right_axis
         self.dir_left = dir_left
         self.dir_right = dir_right
 
+        # Preallocated RX line buffer: responses are read into this with
+        # readinto instead of allocating fresh bytes per byte in readline.
+        # Must exist before the baud probe below, which reads through it.
+        self._rx = bytearray(64)
+        self._rx_mv = memoryview(self._rx)
+        self._rx_len = 0
+
+        # At 115200 an 'f' response alone costs ~1.5ms of wire time; the
+        # firmware supports 921600, which cuts that ~8x. If the drive is
+        # still on its factory rate, configure the faster one over the old
+        # link and reboot it, falling back to 115200 if that fails.
+        if baudrate != 115200 and not self._probe():
+            print(f"No ODrive response at {baudrate} baud, trying 115200...")
+            self.bus.baudrate = 115200
+            if self._probe():
+                print(f"Configuring ODrive for {baudrate} baud and rebooting...")
+                self.bus.write(f'w config.uart_baudrate {baudrate}\n'.encode())
+                # Save to NVM before rebooting: config reloads from NVM on
+                # reboot, so without 'ss' the new rate would be discarded
+                self.bus.write(b'ss\n')
+                time.sleep(0.5)  # Let the save commit
+                self.bus.write(b'sr\n')
+                time.sleep(3)  # Give ODrive time to reboot
+                self.bus.baudrate = baudrate
+                if self._probe():
+                    print(f"ODrive UART now running at {baudrate} baud")
+                else:
+                    print("ODrive did not come back at the new rate, staying at 115200")
+                    self.bus.baudrate = 115200
+
+        # Ask the kernel not to coalesce RX: by default USB-serial adapters
+        # buffer incoming bytes for up to 16ms before waking userspace,
+        # which dominates every query round-trip. Both knobs are best
+        # effort: set_low_latency_mode sets ASYNC_LOW_LATENCY via
+        # TIOCSSERIAL, and the sysfs latency_timer only exists for
+        # FTDI-style usb-serial devices (CDC-ACM ports don't have it; on
+        # those the bInterval under /sys/class/tty/<name>/device plays the
+        # same role).
+        try:
+            self.bus.set_low_latency_mode(True)
+        except (ValueError, NotImplementedError, OSError):
+            pass
+        try:
+            tty_name = os.path.basename(os.path.realpath(port))
+            with open(f'/sys/bus/usb-serial/devices/{tty_name}/latency_timer', 'w') as f:
+                f.write('1')
+        except OSError:
+            pass
+
         # Clear the ASCII UART buffer
         self.bus.reset_input_buffer()
         self.bus.reset_output_buffer()
 
+        # Frequently used config queries, pre-encoded per axis as immutable
+        # bytes so callers on the startup path write them to the UART
+        # without re-formatting an f-string every time
+        self.cmd_templates = {
+            axis: {
+                'control_mode': f'r axis{axis}.controller.config.control_mode\n'.encode(),
+                'input_mode': f'r axis{axis}.controller.config.input_mode\n'.encode(),
+                'vel_ramp_rate': f'r axis{axis}.controller.config.vel_ramp_rate\n'.encode(),
+                'current_lim': f'r axis{axis}.motor.config.current_lim\n'.encode(),
+                'vel_limit': f'r axis{axis}.controller.config.vel_limit\n'.encode(),
+            }
+            for axis in (left_axis, right_axis)
+        }
+
+        # Both feedback queries stacked in one buffer for the pipelined
+        # read in get_pos_vel_both
+        self._feedback_cmd = f'f {left_axis}\nf {right_axis}\n'.encode()
+
+        # Prefixes for the batched velocity write in set_speed_rpm_both
+        self._vel_both_left = f'v {left_axis} '.encode()
+        self._vel_both_right = f'v {right_axis} '.encode()
+
+        # State-transition bursts for both axes, pre-encoded so start/stop/
+        # idle go out as one write each (the ODrive parses stacked lines)
+        self._start_both_cmd = (f'w axis{left_axis}.requested_state 8\n'
+                                f'w axis{right_axis}.requested_state 8\n').encode()
+        self._idle_both_cmd = (f'w axis{left_axis}.requested_state 1\n'
+                               f'w axis{right_axis}.requested_state 1\n').encode()
+        self._stop_both_cmd = (f'w axis{left_axis}.controller.input_vel 0\n'
+                               f'w axis{left_axis}.controller.input_torque 0\n'
+                               f'w axis{right_axis}.controller.input_vel 0\n'
+                               f'w axis{right_axis}.controller.input_torque 0\n').encode()
+
+        # High-frequency setpoint commands, pre-encoded down to the static
+        # prefix: the per-call cost is one bytes %-format of the value,
+        # instead of an f-string build plus encode per tick
+        self._vel_prefix = {
+            axis: f'w axis{axis}.controller.input_vel '.encode()
+            for axis in (left_axis, right_axis)
+        }
+        self._torque_prefix = {
+            axis: b'c %d ' % axis for axis in (left_axis, right_axis)
+        }
+        self._torque_update = {
+            axis: b'\nu %d\n' % axis for axis in (left_axis, right_axis)
+        }
+        self._mps_to_rps = 1.0 / (CFG.ROBOT_WHEEL_RADIUS_M * 2 * math.pi)
+
+
+        # Last velocity setpoint written per axis (in signed rps): writes
+        # within _vel_eps of it are dropped so steady-state streams don't
+        # occupy the bus
+        self._last_vel = {left_axis: None, right_axis: None}
+        self._vel_eps = 0.002
+
+        # Raw fd for hot-path writes: os.write directly skips pyserial's
+        # per-call validation and timeout bookkeeping
+        try:
+            self._fd = self.bus.fileno()
+        except (AttributeError, OSError):
+            self._fd = None
+
+    # ---- Native (binary) protocol, opt-in ----
+    #
+    # The ASCII protocol formats floats to decimal text on Tx and parses
+    # them back on Rx; the native protocol moves fixed little-endian
+    # floats against numeric endpoint ids instead. Endpoint ids and the
+    # endpoint-JSON CRC are specific to the flashed firmware build (they
+    # come from reading endpoint 0), so they must be filled in below and
+    # the framing spot-checked against the target drive before switching
+    # hot paths over. Until then the ASCII path stays the default.
+    NATIVE_JSON_CRC = None   # CRC16 of the firmware's endpoint JSON
+    NATIVE_ENDPOINTS = {}    # e.g. {'axis0.controller.input_vel': 123, ...}
+
+    def _native_packet(self, endpoint_id, payload, response_size):
+        """
+        Frame one native-protocol packet for the UART stream.
+
+        Packet: seq_no, endpoint id (bit 15 = response requested),
+        expected response size, payload, CRC16 seeded with the endpoint
+        JSON CRC. Stream wrapper: 0xAA sync, length, CRC8 over the
+        header, packet bytes.
+        """
+        if self.NATIVE_JSON_CRC is None:
+            raise RuntimeError(
+                "Native protocol not configured: set NATIVE_JSON_CRC and "
+                "NATIVE_ENDPOINTS for the flashed firmware first")
+        self._native_seq = (getattr(self, '_native_seq', 0) + 1) & 0x7FFF
+        packet = struct.pack('<HHH', self._native_seq,
+                             endpoint_id | 0x8000, response_size) + payload
+        packet += struct.pack('<H', _crc16(packet, self.NATIVE_JSON_CRC))
+        header = bytes((0xAA, len(packet)))
+        return header + bytes((_crc8(header),)) + packet
+
+    def _native_write(self, endpoint_id, payload):
+        """
+        Set an endpoint value over the native protocol (no response).
+        """
+        self.bus.write(self._native_packet(endpoint_id, payload, 0))
+
+    def _native_read(self, endpoint_id, size):
+        """
+        Request an endpoint value over the native protocol and return the
+        raw little-endian payload bytes (empty on timeout).
+        """
+        self._flush_rx()
+        self.bus.write(self._native_packet(endpoint_id, b'', size))
+        return self.bus.read(size)
+
+    def set_input_vel_native(self, axis, rps):
+        """
+        Velocity setpoint via the native protocol: one packed float
+        instead of a formatted decimal string.
+        """
+        ep = self.NATIVE_ENDPOINTS[f'axis{axis}.controller.input_vel']
+        self._native_write(ep, struct.pack('<f', rps))
+
+    def _probe(self):
+        """
+        Check whether the ODrive answers a trivial query at the current
+        baudrate.
+        """
+        try:
+            # Retry once: with the 50ms timeout a single lost response
+            # would otherwise read as "wrong baudrate" and set off a
+            # needless reconfigure-and-reboot cycle
+            for _ in range(2):
+                self._flush_rx()
+                self.bus.write(b'r vbus_voltage\n')
+                response = self._read_line()
+                if response:
+                    break
+            return _NUM.search(response.decode('ascii', 'replace')) is not None
+        except (OSError, serial.SerialException):
+            return False
+
+    def _raw_write(self, buf):
+        """
+        Write straight to the serial fd, bypassing the pyserial wrapper.
+        """
+        if self._fd is not None:
+            os.write(self._fd, buf)
+        else:
+            self.bus.write(buf)
+
+    def _flush_rx(self):
+        """
+        Discard everything in the RX path, kernel buffer and ours.
+        """
+        self.bus.reset_input_buffer()
+        self._rx_len = 0
+
+    def _read_line(self):
+        """
+        Read one newline-terminated response into the preallocated RX
+        buffer and return it as stripped bytes (empty on timeout).
+
+        Bytes that arrive past the newline stay buffered for the next
+        call, so pipelined multi-line responses drain correctly.
+        """
+        rx = self._rx
+        mv = self._rx_mv
+        pos = self._rx_len
+        while True:
+            end = rx.find(b'\n', 0, pos)
+            if end >= 0:
+                line = bytes(rx[:end]).strip()
+                rest = pos - end - 1
+                if rest:
+                    mv[:rest] = mv[end + 1:pos]
+                self._rx_len = rest
+                return line
+            if pos >= len(rx):
+                pos = 0  # overlong garbage line; start over
+            # Grab whatever already arrived in one readinto; fall back to a
+            # single blocking byte when the buffer is empty
+            avail = self.bus.in_waiting
+            want = min(avail, len(rx) - pos) if avail > 0 else 1
+            n = self.bus.readinto(mv[pos:pos + want])
+            if not n:
+                # Timeout: hand back the partial line, like readline would
+                self._rx_len = 0
+                return bytes(rx[:pos]).strip()
+            pos += n
+
     def send_command(self, command: str):
         """
         Send a command to the ODrive and return the response if applicable.
         """
-        self.bus.reset_input_buffer()
-        self.bus.write(f"{command}\n".encode())
         if command.startswith('r') or command.startswith('f'):
-            response = self.bus.readline().decode('ascii').strip()
+            # Only queries need a clean RX buffer; flushing on every
+            # fire-and-forget write cost a TCFLSH ioctl per motion update
+            self._flush_rx()
+            self.bus.write(f"{command}\n".encode())
+            response = self._read_line().decode('ascii')
             if response == '':
                 print(f"No response received for command: {command}")
             return response
+        self._raw_write(f"{command}\n".encode())
+
+    def send_command_with_retry(self, command: str, retries=2):
+        """
+        Send a query command, retrying on an empty response.
+
+        With the short serial timeout a transient glitch shows up as an
+        empty read; one or two retries recover without stalling the caller.
+        """
+        response = self.send_command(command)
+        for _ in range(retries):
+            if response:
+                break
+            response = self.send_command(command)
+        return response
+
+    def send_command_bytes(self, command: bytes):
+        """
+        Send a pre-encoded command (newline included) to the ODrive and
+        return the response if applicable.
+        """
+        if command.startswith(b'r') or command.startswith(b'f'):
+            self._flush_rx()
+            self.bus.write(command)
+            response = self._read_line().decode('ascii')
+            if response == '':
+                print(f"No response received for command: {command!r}")
+            return response
+        self._raw_write(command)
+
+    def send_command_bytes_with_retry(self, command: bytes, retries=2):
+        """
+        Bytes counterpart of send_command_with_retry.
+        """
+        response = self.send_command_bytes(command)
+        for _ in range(retries):
+            if response:
+                break
+            response = self.send_command_bytes(command)
+        return response
     
     def get_errors_left(self):
         """
@@ -71,12 +391,12 @@ class ODriveUART:
         """
         error_code = -1
         error_name = 'Unknown error'
-        error_response = self.send_command(f'r axis{axis}.error')
-        try:
-            cleaned_response = ''.join(c for c in error_response if c.isdigit())
-            error_code = int(cleaned_response)
+        error_response = self.send_command_with_retry(f'r axis{axis}.error')
+        m = _NUM.search(error_response)
+        if m:
+            error_code = int(m.group())
             error_name = self.ERROR_DICT.get(error_code, error_name)
-        except ValueError:
+        else:
             print(f"Unexpected error response format: {error_response}")
         return error_code, error_name
 
@@ -85,14 +405,12 @@ class ODriveUART:
         Check if there are any errors on either axis.
         """
         for axis in [0,1]:
-            error_response = self.send_command(f'r axis{axis}.error')
-            try:
-                cleaned_response = ''.join(c for c in error_response if c.isdigit())
-                error_code = int(cleaned_response)
-            except ValueError:
+            error_response = self.send_command_with_retry(f'r axis{axis}.error')
+            m = _NUM.search(error_response)
+            if not m:
                 print(f"Unexpected error response format: {error_response}")
                 return True
-            if error_code != 0:
+            if int(m.group()) != 0:
                 return True
         return False
 
@@ -106,24 +424,26 @@ class ODriveUART:
         ]
         print('======= ODrive Errors =======')
         for src in error_sources:
-            error_response = self.send_command(f'r {src}.error')
-            try:
-                cleaned_response = ''.join(c for c in error_response if c.isdigit())
-                error_code = int(cleaned_response)
-            except ValueError:
+            error_response = self.send_command_with_retry(f'r {src}.error')
+            m = _NUM.search(error_response)
+            if not m:
                 print(f"Unexpected error response format: {error_response}")
                 continue
+            error_code = int(m.group())
 
             if error_code == 0:
                 print(src+'.error=0x0: \033[92mNone\033[0m')
                 continue
 
-            error_prefix = f"{src.split('.')[-1].strip('01').upper()}_ERROR"
-            error_dict = {name: value for name, value in vars(odrive.enums).items() if name.startswith(error_prefix)}
+            prefix = src.split('.')[-1].strip('01').upper()
             error_string = ""
-            for error_name, code in error_dict.items():
-                if error_code & code:
-                    error_string += f"{error_name.replace(error_prefix + '_', '').lower().replace('_', ' ')}, "
+            remaining = error_code
+            for error_name, code in self._PREFIX_TABLES[prefix].items():
+                if remaining & code:
+                    error_string += f"{error_name.replace(prefix + '_ERROR_', '').lower().replace('_', ' ')}, "
+                    remaining &= ~code
+                    if not remaining:
+                        break  # all set bits named; skip the rest of the table
             error_string = error_string.rstrip(", ")
             print(f"{src}.error={hex(error_code)}: \033[91m{error_string}\033[0m")
         print('=============================')
@@ -189,32 +509,66 @@ class ODriveUART:
         """
         self.send_command(f'w axis{axis}.requested_state 8')
 
-    def set_speed_rpm_left(self, rpm):
+    def start_both(self):
+        """
+        Start both axes with a single write burst.
+        """
+        self._raw_write(self._start_both_cmd)
+
+    def set_speed_rpm_left(self, rpm, force=False):
         """
         Set the speed in RPM for the left axis.
         """
-        self.set_speed_rpm(self.left_axis, rpm, self.dir_left)
+        self.set_speed_rpm(self.left_axis, rpm, self.dir_left, force)
 
-    def set_speed_rpm_right(self, rpm):
+    def set_speed_rpm_right(self, rpm, force=False):
         """
         Set the speed in RPM for the right axis.
         """
-        self.set_speed_rpm(self.right_axis, rpm, self.dir_right)
+        self.set_speed_rpm(self.right_axis, rpm, self.dir_right, force)
 
-    def set_speed_rpm(self, axis, rpm, direction):
+    def set_speed_rpm(self, axis, rpm, direction, force=False):
         """
         Set the speed in RPM for the specified axis.
-        """
-        rps = rpm / 60
-        self.send_command(f'w axis{axis}.controller.input_vel {rps * direction:.4f}')
+
+        Redundant writes (within _vel_eps rps of the last sent value) are
+        skipped unless force is set, as by the emergency-stop paths.
+        """
+        rps = rpm / 60 * direction
+        last = self._last_vel[axis]
+        if not force and last is not None and abs(rps - last) < self._vel_eps:
+            return
+        self._last_vel[axis] = rps
+        self._raw_write(self._vel_prefix[axis] + b'%.4f\n' % (rps,))
+
+    def set_speed_rpm_both(self, left_rpm, right_rpm, force=False):
+        """
+        Set the speed in RPM for both axes with a single UART write.
+
+        Stacks the two velocity commands in one buffer so both go out in
+        one write() syscall and one bus turnaround instead of two. Skipped
+        entirely when neither axis moved by _vel_eps rps (unless force).
+        """
+        left_rps = left_rpm * self.dir_left / 60
+        right_rps = right_rpm * self.dir_right / 60
+        last_left = self._last_vel[self.left_axis]
+        last_right = self._last_vel[self.right_axis]
+        if (not force and last_left is not None and last_right is not None
+                and abs(left_rps - last_left) < self._vel_eps
+                and abs(right_rps - last_right) < self._vel_eps):
+            return
+        self._last_vel[self.left_axis] = left_rps
+        self._last_vel[self.right_axis] = right_rps
+        self._raw_write(self._vel_both_left + b'%.4f\n' % (left_rps,)
+                        + self._vel_both_right + b'%.4f\n' % (right_rps,))
 
     def set_speed_mps_left(self, mps):
-        rps = mps / (CFG.ROBOT_WHEEL_RADIUS_M * 2 * 3.14159)
-        self.send_command(f'w axis{self.left_axis}.controller.input_vel {rps * self.dir_left:.4f}')
+        # Through set_speed_rpm so the setpoint cache stays coherent and
+        # redundant writes are coalesced like every other velocity path
+        self.set_speed_rpm(self.left_axis, mps * self._mps_to_rps * 60, self.dir_left)
 
     def set_speed_mps_right(self, mps):
-        rps = mps / (CFG.ROBOT_WHEEL_RADIUS_M * 2 * 3.14159)
-        self.send_command(f'w axis{self.right_axis}.controller.input_vel {rps * self.dir_right:.4f}')
+        self.set_speed_rpm(self.right_axis, mps * self._mps_to_rps * 60, self.dir_right)
 
     def set_torque_nm_left(self, nm):
         """
@@ -234,8 +588,10 @@ class ODriveUART:
         """
         torque_bias = 0.05 # Small torque bias in Nm
         adjusted_torque = nm * direction + (torque_bias * direction * (1 if nm >= 0 else -1))
-        self.send_command(f'c {axis} {adjusted_torque:.4f}')
-        self.send_command(f'u {axis}')
+        # Torque value and the watchdog-feeding update stacked in one write
+        self._raw_write(self._torque_prefix[axis]
+                        + b'%.4f' % (adjusted_torque,)
+                        + self._torque_update[axis])
 
     def get_speed_rpm_left(self):
         """
@@ -253,7 +609,7 @@ class ODriveUART:
         """
         Get the speed in RPM for the specified axis.
         """
-        response = self.send_command(f'r axis{axis}.encoder.vel_estimate')
+        response = self.send_command_with_retry(f'r axis{axis}.encoder.vel_estimate')
         return float(response) * direction * 60
 
     def get_position_turns_left(self):
@@ -272,7 +628,7 @@ class ODriveUART:
         """
         Get the position in turns for the specified axis.
         """
-        response = self.send_command(f'r axis{axis}.encoder.pos_estimate')
+        response = self.send_command_with_retry(f'r axis{axis}.encoder.pos_estimate')
         return float(response) * direction
     
     def get_pos_vel_left(self):
@@ -291,9 +647,35 @@ class ODriveUART:
         """
         Get the position and velocity for the specified axis.
         """
-        pos, vel = self.send_command(f'f {axis}').split(' ')
+        pos, vel = self.send_command_with_retry(f'f {axis}').split(' ')
         return float(pos) * direction, float(vel) * direction * 60
 
+    def get_pos_vel_both(self):
+        """
+        Get position and velocity for both axes with one pipelined query.
+
+        The ODrive answers stacked ASCII commands in order, so both 'f'
+        requests go out in a single write and the two response lines are
+        drained back to back — one bus round-trip instead of two.
+        Returns (left_pos, left_vel_rpm, right_pos, right_vel_rpm).
+        """
+        # Retry the whole exchange when a line times out empty or comes
+        # back mangled — the same recovery the single-line queries get
+        # from send_command_with_retry
+        for _ in range(3):
+            self._flush_rx()
+            self.bus.write(self._feedback_cmd)
+            left = self._read_line().split()
+            right = self._read_line().split()
+            if len(left) == 2 and len(right) == 2:
+                break
+        left_pos, left_vel = left
+        right_pos, right_vel = right
+        return (float(left_pos) * self.dir_left,
+                float(left_vel) * self.dir_left * 60,
+                float(right_pos) * self.dir_right,
+                float(right_vel) * self.dir_right * 60)
+
     def stop_left(self):
         """
         Stop the left axis.
@@ -312,6 +694,17 @@ class ODriveUART:
         """
         self.send_command(f'w axis{axis}.controller.input_vel 0')
         self.send_command(f'w axis{axis}.controller.input_torque 0')
+        # Bypassed the setpoint cache above; invalidate it so the next
+        # velocity command is always transmitted
+        self._last_vel[axis] = None
+
+    def stop_both(self):
+        """
+        Stop both axes with a single write burst.
+        """
+        self._raw_write(self._stop_both_cmd)
+        self._last_vel[self.left_axis] = None
+        self._last_vel[self.right_axis] = None
 
     def set_idle_left(self):
         """
@@ -333,6 +726,13 @@ class ODriveUART:
         self.send_command(f'w axis{axis}.requested_state 1')
         print(f"Axis {axis} set to idle state")
 
+    def set_idle_both(self):
+        """
+        Set both axes to idle mode with a single write burst.
+        """
+        self._raw_write(self._idle_both_cmd)
+        print("Both axes set to idle state")
+
     def check_errors_left(self):
         """
         Check for errors on the left axis.
@@ -349,13 +749,12 @@ class ODriveUART:
         """
         Check for errors on the specified axis.
         """
-        response = self.send_command(f'r axis{axis}.error')
-        try:
-            cleaned_response = ''.join(c for c in response if c.isdigit())
-            return int(cleaned_response) != 0
-        except ValueError:
-            print(f"Unexpected response format: {response}")
-            return True
+        response = self.send_command_with_retry(f'r axis{axis}.error')
+        m = _NUM.search(response)
+        if m:
+            return int(m.group()) != 0
+        print(f"Unexpected response format: {response}")
+        return True
 
     def clear_errors_left(self):
         """
@@ -474,7 +873,7 @@ class ODriveUART:
         """
         Get the current velocity ramp rate for the specified axis.
         """
-        response = self.send_command(f'r axis{axis}.controller.config.vel_ramp_rate')
+        response = self.send_command_with_retry(f'r axis{axis}.controller.config.vel_ramp_rate')
         try:
             return float(response)
         except (ValueError, TypeError):
@@ -518,8 +917,7 @@ if __name__ == '__main__':
     motor_controller = ODriveUART('/dev/odrive', left_axis=0, right_axis=1, dir_left=1, dir_right=-1)
 
     # Start the motors and set to velocity mode
-    motor_controller.start_left()
-    motor_controller.start_right()
+    motor_controller.start_both()
     
     # Configure for velocity mode with PASSTHROUGH (direct drive) for immediate response
     motor_controller.enable_velocity_mode_left()
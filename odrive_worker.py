@@ -0,0 +1,171 @@
+# odrive_worker.py
+import queue
+import time
+from multiprocessing import Process, Queue, shared_memory
+
+import numpy as np
+
+import constants as CFG
+from odrive_uart import ODriveUART
+
+# Layout of the shared telemetry block (float64 each)
+TELEM_LEFT_POS = 0
+TELEM_LEFT_VEL_RPM = 1
+TELEM_RIGHT_POS = 2
+TELEM_RIGHT_VEL_RPM = 3
+TELEM_TIMESTAMP = 4
+TELEM_FIELDS = 5
+
+
+def _worker_loop(cmd_q, shm_name, port, left_axis, right_axis,
+                 dir_left, dir_right, period):
+    """Process target that owns the serial port.
+
+    Drains the command queue keeping only the newest setpoint (stale
+    commands are dropped, latest value wins), writes it to the ODrive,
+    then refreshes the shared telemetry block with a pipelined both-axes
+    feedback query.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    telem = np.ndarray((TELEM_FIELDS,), dtype=np.float64, buffer=shm.buf)
+
+    odrive = ODriveUART(port, left_axis=left_axis, right_axis=right_axis,
+                        dir_left=dir_left, dir_right=dir_right)
+
+    running = True
+    try:
+        while running:
+            # Coalesce: only the most recent velocity command is sent
+            latest = None
+            try:
+                while True:
+                    cmd = cmd_q.get_nowait()
+                    if cmd[0] == 'quit':
+                        running = False
+                    elif cmd[0] == 'stop':
+                        latest = cmd
+                    else:
+                        latest = cmd
+            except queue.Empty:
+                pass
+
+            try:
+                if latest is not None:
+                    if latest[0] == 'stop':
+                        odrive.stop_left()
+                        odrive.stop_right()
+                    else:
+                        odrive.set_speed_rpm_both(latest[1], latest[2])
+
+                (telem[TELEM_LEFT_POS], telem[TELEM_LEFT_VEL_RPM],
+                 telem[TELEM_RIGHT_POS], telem[TELEM_RIGHT_VEL_RPM]) = \
+                    odrive.get_pos_vel_both()
+                telem[TELEM_TIMESTAMP] = time.monotonic()
+            except Exception as e:
+                print(f"ODrive worker serial error: {e}")
+                time.sleep(0.1)
+
+            time.sleep(period)
+    finally:
+        try:
+            odrive.stop_left()
+            odrive.stop_right()
+            odrive.set_idle_left()
+            odrive.set_idle_right()
+        except Exception as e:
+            print(f"ODrive worker shutdown error: {e}")
+        shm.close()
+
+
+class ODriveWorker:
+    """Nonblocking facade over an ODrive owned by a background process.
+
+    The control loop never touches the serial port: set_speed_rpm_both
+    drops the newest setpoint into a queue, and get_pos_vel_both reads
+    the latest telemetry out of shared memory. Serial stalls therefore
+    cost the worker process time, not control-loop time.
+    """
+
+    def __init__(self, port=CFG.MOTOR_CONTROL_SERIAL_PORT,
+                 left_axis=CFG.MOTOR_CONTROL_LEFT_MOTOR_AXIS,
+                 right_axis=CFG.MOTOR_CONTROL_RIGHT_MOTOR_AXIS,
+                 dir_left=CFG.MOTOR_CONTROL_LEFT_MOTOR_DIR,
+                 dir_right=CFG.MOTOR_CONTROL_RIGHT_MOTOR_DIR,
+                 period=0.005):
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=TELEM_FIELDS * 8)
+        self._telem = np.ndarray((TELEM_FIELDS,), dtype=np.float64,
+                                 buffer=self._shm.buf)
+        self._telem[:] = 0.0
+        self._cmd_q = Queue(maxsize=8)
+        self._proc = Process(
+            target=_worker_loop,
+            args=(self._cmd_q, self._shm.name, port, left_axis, right_axis,
+                  dir_left, dir_right, period),
+            daemon=True)
+        self._proc.start()
+
+    def _put_latest(self, cmd):
+        """Queue a command without ever blocking the caller."""
+        try:
+            self._cmd_q.put_nowait(cmd)
+        except queue.Full:
+            # Worker is behind; drop the oldest queued command and retry
+            try:
+                self._cmd_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._cmd_q.put_nowait(cmd)
+            except queue.Full:
+                pass
+
+    def set_speed_rpm_both(self, left_rpm, right_rpm):
+        """Queue the newest wheel speed command (nonblocking)."""
+        self._put_latest(('vel', left_rpm, right_rpm))
+
+    def stop_motors(self):
+        """Queue a stop for both axes (nonblocking)."""
+        self._put_latest(('stop',))
+
+    def get_pos_vel_both(self):
+        """Latest telemetry, straight from shared memory (nonblocking).
+
+        Returns (left_pos, left_vel_rpm, right_pos, right_vel_rpm).
+        """
+        t = self._telem
+        return (t[TELEM_LEFT_POS], t[TELEM_LEFT_VEL_RPM],
+                t[TELEM_RIGHT_POS], t[TELEM_RIGHT_VEL_RPM])
+
+    def telemetry_age(self):
+        """Seconds since the worker last refreshed the telemetry block."""
+        return time.monotonic() - self._telem[TELEM_TIMESTAMP]
+
+    def close(self):
+        """Stop the worker process and release the shared memory."""
+        try:
+            self._cmd_q.put(('quit',), timeout=0.5)
+        except queue.Full:
+            pass
+        self._proc.join(timeout=2.0)
+        if self._proc.is_alive():
+            self._proc.terminate()
+        self._shm.close()
+        self._shm.unlink()
+
+
+if __name__ == '__main__':
+    worker = ODriveWorker()
+    try:
+        print("Spinning both wheels via the worker process...")
+        for rpm in [30, 60, 0, -30, 0]:
+            print(f"Setting both wheels to {rpm} RPM...")
+            worker.set_speed_rpm_both(rpm, rpm)
+            time.sleep(2)
+            print(f"Telemetry: {worker.get_pos_vel_both()} "
+                  f"(age {worker.telemetry_age():.3f}s)")
+    finally:
+        print("Shutting down worker...")
+        worker.stop_motors()
+        time.sleep(0.5)
+        worker.close()
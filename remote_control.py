@@ -1,154 +1,267 @@
 # remote_control.py
-import os
 import pygame
+import queue
 import time
 import threading
 import signal
 import sys
+
+import numpy as np
+
 from motor_control import MotorControl
 
-# Fix for headless environments (SSH, no GUI)
-os.environ["SDL_VIDEODRIVER"] = "dummy"
+# Event types the controller consumes, hoisted so the per-tick filtered
+# drain doesn't rebuild the list. Everything is dispatched in one batch
+# per tick, so a backlog built up during the wait (button mashing) is
+# cleared in a single Python loop instead of one event per iteration.
+# JOYAXISMOTION is queued so stick motion wakes the blocking wait and
+# arms the fast tick; the values themselves still come from the axis
+# snapshot, the event is just the wakeup.
+_JOY_EVENT_TYPES = [pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED,
+                    pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+                    pygame.JOYAXISMOTION]
+
+# Shared "no input" result so the early-return paths don't build a fresh
+# tuple every tick
+_NO_INPUT = (0.0, 0.0, False)
 
 class RemoteController:
     def __init__(self):
-        pygame.init()
+        # Joystick-only init: pygame.init() would bring up every subsystem
+        # including video (needing the SDL_VIDEODRIVER=dummy hack when
+        # headless) and feed window events into the queue. The event
+        # module works without video since pygame 2.2.
         pygame.joystick.init()
         
+        # Queue only the types the drain consumes. Anything else would
+        # sit in the queue forever — the filtered get() never removes it —
+        # so event.wait would return immediately every tick and the loop
+        # would busy-spin instead of blocking.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_JOY_EVENT_TYPES)
+        
         self.joystick = None
         self.running = True
         self.motor_control = MotorControl()
         
+        # Buttons currently held, maintained from JOYBUTTONDOWN/UP events
+        # instead of polling SDL per button per tick
+        self._buttons_down = set()
+        
+        # Hot-path logging goes through a bounded queue to a daemon
+        # thread, so the control loop never holds the GIL through a
+        # stdio write syscall; overflow drops the message instead of
+        # stalling the tick
+        self._log_q = queue.Queue(maxsize=256)
+        threading.Thread(target=self._log_loop, daemon=True).start()
+        
         # Control parameters
         self.deadzone = 0.1  # Ignore joystick values below this threshold
         self.max_linear_speed = 4.0  # Maximum linear speed in m/s
         self.max_angular_speed = 8.0  # Maximum angular speed in rad/s
         self.speed_multiplier = 1.0  # Normal speed multiplier
         self.turbo_multiplier = 2.0  # Turbo speed multiplier
+        # Scale tables indexed by turbo state so the hot path is a single
+        # multiply per axis instead of a branch plus two multiplies
+        self._lin_scale = (self.max_linear_speed * self.speed_multiplier,
+                           self.max_linear_speed * self.turbo_multiplier)
+        self._ang_scale = (self.max_angular_speed * self.speed_multiplier,
+                           self.max_angular_speed * self.turbo_multiplier)
+        self._turbo_was_active = False
         
         # Smoothing parameters
         self.current_linear = 0.0
         self.current_angular = 0.0
         self.smoothing_factor = 0.3  # 0.1 = very smooth, 0.9 = very responsive
         
-        # Safety and monitoring
-        self.last_activity_time = time.time()
+        # Safety and monitoring. The input path sets a touch flag instead
+        # of storing a timestamp; the watchdog samples and clears it at a
+        # coarse interval, so the per-input fast path does no clock work.
+        self._touched = False
         self.watchdog_timeout = 1.0  # seconds without input before stopping
+        self._watchdog_interval = 0.5  # how often the touch flag is sampled
+        # Consecutive clear samples needed before stopping, so the
+        # configured timeout is honored as a lower bound
+        self._watchdog_limit = max(1, int(self.watchdog_timeout / self._watchdog_interval))
+        self._watchdog_misses = 0
+        self._next_watchdog_check = time.monotonic() + self.watchdog_timeout
         self.connection_active = False
         self.emergency_stop_active = False
         
-        # Control loop timing
-        self.control_loop_rate = 0.01  # 10ms = 100Hz
+        # Control loop timing: tight tick while actively driving, long
+        # tick while idle. event.wait still wakes immediately on any
+        # event, so the idle rate only bounds watchdog/housekeeping lag.
+        self.control_loop_rate = 0.005  # 5ms = 200Hz while active
+        self.idle_loop_rate = 0.1  # 100ms while idle
+        self._active_until = 0.0  # active window deadline (monotonic)
         
         print("Remote Controller initialized")
         print(f"Deadzone: {self.deadzone}")
         print(f"Max speeds - Linear: {self.max_linear_speed} m/s, Angular: {self.max_angular_speed} rad/s")
         print(f"Watchdog timeout: {self.watchdog_timeout} seconds")
         
-    def apply_deadzone(self, value):
-        """Apply deadzone to joystick values to prevent drift"""
-        if abs(value) < self.deadzone:
-            return 0.0
-        return value
+    def _log(self, msg):
+        """Queue a message for the logger thread (never blocks)"""
+        try:
+            self._log_q.put_nowait(msg)
+        except queue.Full:
+            pass
+    
+    def _log_loop(self):
+        """Drain queued messages and print them off the control thread"""
+        while True:
+            print(self._log_q.get())
     
     def check_joystick_connection(self):
         """Check and initialize joystick connection"""
         if self.joystick is None or not self.joystick.get_init():
-            pygame.joystick.quit()
-            pygame.joystick.init()
-            
             if pygame.joystick.get_count() > 0:
-                self.joystick = pygame.joystick.Joystick(0)
-                self.joystick.init()
-                self.connection_active = True
-                self.last_activity_time = time.time()
-                print(f"Joystick connected: {self.joystick.get_name()}")
-                return True
-            else:
-                if self.connection_active:
-                    print("Joystick disconnected")
-                    self.send_stop_command("Joystick disconnected")
-                self.connection_active = False
-                return False
+                return self.connect_joystick(0)
+            if self.connection_active:
+                self._log("Joystick disconnected")
+                self.send_stop_command("Joystick disconnected")
+            self.connection_active = False
+            return False
+        return True
+    
+    def connect_joystick(self, device_index):
+        """Bind the joystick at the given SDL device index"""
+        self.joystick = pygame.joystick.Joystick(device_index)
+        self.joystick.init()
+        # Bind the per-tick accessors once; at 100 Hz the repeated
+        # attribute lookups on self.joystick are measurable
+        self._get_axis = self.joystick.get_axis
+        self._numaxes = self.joystick.get_numaxes()
+        self.connection_active = True
+        self._touched = True
+        self._log(f"Joystick connected: {self.joystick.get_name()}")
         return True
     
     def send_stop_command(self, reason):
         """Send stop command to motors"""
-        print(f"STOP: {reason}")
+        self._log(f"STOP: {reason}")
         self.motor_control.set_linear_angular_velocities(0.0, 0.0)
         self.current_linear = 0.0
         self.current_angular = 0.0
     
     def emergency_stop(self, reason):
         """Emergency stop with motor controller emergency stop"""
-        print(f"EMERGENCY STOP: {reason}")
+        self._log(f"EMERGENCY STOP: {reason}")
         self.emergency_stop_active = True
         self.motor_control.emergency_stop(reason)
         self.current_linear = 0.0
         self.current_angular = 0.0
     
-    def process_joystick_input(self):
+    def process_joystick_input(self, now):
         """Process joystick input and return target velocities"""
-        if not self.joystick or not self.joystick.get_init():
-            return 0.0, 0.0, False
+        # While emergency-stopped there is nothing to compute and nothing
+        # to send: short-circuit before touching SDL at all
+        if self.emergency_stop_active:
+            return _NO_INPUT
         
-        # Handle pygame events for hotplug detection
-        for event in pygame.event.get():
-            if event.type == pygame.JOYDEVICEREMOVED:
+        # Drain hotplug and button events in one filtered batch. Filtering
+        # at the source means SDL copies just these types out of the queue
+        # in one pass instead of building a Python object per queued event;
+        # the get() also pumps, so no separate pump() is needed. This runs
+        # even with no joystick bound — reconnection is driven entirely by
+        # these events now, not by periodic polling.
+        for event in pygame.event.get(_JOY_EVENT_TYPES):
+            if event.type == pygame.JOYAXISMOTION:
+                # Consumed only as a wakeup: arm the fast tick so the
+                # first deflection after idle is processed this tick,
+                # not after a full idle wait
+                self._active_until = now + 0.5
+            elif event.type == pygame.JOYBUTTONDOWN:
+                self._buttons_down.add(event.button)
+            elif event.type == pygame.JOYBUTTONUP:
+                self._buttons_down.discard(event.button)
+            elif event.type == pygame.JOYDEVICEREMOVED:
                 if hasattr(event, 'instance_id') and self.joystick and event.instance_id == self.joystick.get_instance_id():
-                    print("Joystick removed via pygame event")
+                    self._log("Joystick removed via pygame event")
                     self.send_stop_command("Joystick removed")
                     self.joystick = None
                     self.connection_active = False
-                    return 0.0, 0.0, False
+                    self._buttons_down.clear()
+                    return _NO_INPUT
             elif event.type == pygame.JOYDEVICEADDED:
                 if not self.joystick:
-                    print("New joystick detected via pygame event")
-                    self.check_joystick_connection()
+                    self._log("New joystick detected via pygame event")
+                    self.connect_joystick(event.device_index)
+        
+        if not self.joystick or not self.joystick.get_init():
+            return _NO_INPUT
         
-        pygame.event.pump()
+        # Snapshot all axes at once and deadzone them in one vectorized
+        # op, same pattern as test_controller; also keeps every axis
+        # available if more channels get mapped later
+        axes = np.fromiter((self._get_axis(i) for i in range(self._numaxes)),
+                           dtype=np.float32, count=self._numaxes)
+        axes[np.abs(axes) < self.deadzone] = 0.0
         
-        # Get joystick input
         # Left stick Y-axis for forward/backward (inverted)
-        linear_input = -self.joystick.get_axis(1)
+        linear_input = -float(axes[1])
         # Right stick X-axis for left/right turning
-        angular_input = self.joystick.get_axis(2)
-        
-        # Apply deadzone
-        linear_input = self.apply_deadzone(linear_input)
-        angular_input = self.apply_deadzone(angular_input)
+        angular_input = float(axes[2])
         
         # Check for emergency stop button (Button B - typically button 1)
-        if self.joystick.get_button(1):
+        if 1 in self._buttons_down:
             self.emergency_stop("Emergency stop button pressed")
-            return 0.0, 0.0, False
+            return _NO_INPUT
         
         # Check for turbo mode (Right bumper - typically button 7)
-        turbo_active = self.joystick.get_button(7)
-        current_multiplier = self.turbo_multiplier if turbo_active else self.speed_multiplier
+        turbo_active = 7 in self._buttons_down
         
-        if turbo_active:
-            print("TURBO MODE ACTIVE")
+        # Print on the rising edge only; an unconditional print here is a
+        # GIL-serialized write syscall every tick while the bumper is held
+        if turbo_active and not self._turbo_was_active:
+            self._log("TURBO MODE ACTIVE")
+        self._turbo_was_active = turbo_active
         
         # Calculate target velocities
-        target_linear = linear_input * self.max_linear_speed * current_multiplier
-        target_angular = angular_input * self.max_angular_speed * current_multiplier
+        target_linear = linear_input * self._lin_scale[turbo_active]
+        target_angular = angular_input * self._ang_scale[turbo_active]
         
         # Check if we have any input
         has_input = (abs(linear_input) > 0.0 or abs(angular_input) > 0.0)
         
         if has_input:
-            self.last_activity_time = time.time()
+            self._touched = True
+            # Stay on the tight tick for a while after the last input
+            self._active_until = now + 0.5
         
         return target_linear, target_angular, has_input
     
-    def watchdog_check(self):
+    def wait_for_tick(self, now):
+        """Block until an event arrives or one control tick elapses.
+
+        pygame.event.wait maps to SDL_WaitEventTimeout, so the OS parks the
+        process instead of us spinning through sleep+poll: idle CPU drops to
+        near zero and fresh input wakes us immediately instead of waiting out
+        the rest of the tick. The tick length adapts to activity — 5 ms
+        while driving, 100 ms once the stick has been idle for half a
+        second. Any event that wakes us is posted back so the dispatch in
+        process_joystick_input still sees it.
+        """
+        rate = self.control_loop_rate if now < self._active_until else self.idle_loop_rate
+        event = pygame.event.wait(int(rate * 1000))
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+
+    def watchdog_check(self, now):
         """Check if we've lost communication and should stop"""
-        current_time = time.time()
-        time_since_activity = current_time - self.last_activity_time
+        if now < self._next_watchdog_check:
+            return True
+        self._next_watchdog_check = now + self._watchdog_interval
         
-        if time_since_activity > self.watchdog_timeout and self.connection_active:
-            self.send_stop_command(f"Watchdog timeout: {time_since_activity:.1f}s without input")
+        if self._touched:
+            self._touched = False
+            self._watchdog_misses = 0
+            return True
+        self._watchdog_misses += 1
+        if self._watchdog_misses >= self._watchdog_limit and self.connection_active:
+            self._watchdog_misses = 0
+            self.send_stop_command(
+                f"Watchdog timeout: no input for {self.watchdog_timeout:.1f}s")
             return False
         return True
     
@@ -162,30 +275,26 @@ class RemoteController:
         print("  Button B: Emergency stop")
         print("  Ctrl+C: Quit")
         
-        last_connection_check = time.time()
-        connection_check_interval = 1.0  # Check connection every second
+        # Initial connect; after this, hotplug events keep self.joystick
+        # current with no periodic SDL re-init
+        self.check_joystick_connection()
         
         try:
             while self.running:
-                current_time = time.time()
-                
-                # Periodic connection check
-                if current_time - last_connection_check > connection_check_interval:
-                    self.check_joystick_connection()
-                    last_connection_check = current_time
+                current_time = time.monotonic()
                 
                 # Skip control if emergency stop is active
                 if self.emergency_stop_active:
-                    time.sleep(self.control_loop_rate)
+                    self.wait_for_tick(current_time)
                     continue
                 
                 # Watchdog check
-                if not self.watchdog_check():
-                    time.sleep(self.control_loop_rate)
+                if not self.watchdog_check(current_time):
+                    self.wait_for_tick(current_time)
                     continue
                 
                 # Process joystick input
-                target_linear, target_angular, has_input = self.process_joystick_input()
+                target_linear, target_angular, has_input = self.process_joystick_input(current_time)
                 
                 # Smooth velocity transitions
                 self.current_linear += (target_linear - self.current_linear) * self.smoothing_factor
@@ -198,8 +307,8 @@ class RemoteController:
                     print(f"Error sending motor commands: {e}")
                     self.emergency_stop("Motor control error")
                 
-                # Control loop timing
-                time.sleep(self.control_loop_rate)
+                # Control loop timing: block on the event queue, not sleep
+                self.wait_for_tick(current_time)
                 
         except KeyboardInterrupt:
             print("\nShutdown requested by user")
@@ -1,6 +1,8 @@
 import pygame
 import time
 
+import numpy as np
+
 pygame.init()
 pygame.joystick.init()
 
@@ -14,19 +16,41 @@ joystick.init()
 
 print(f"Connected to: {joystick.get_name()}")
 
+num_axes = joystick.get_numaxes()
+num_buttons = joystick.get_numbuttons()
+num_hats = joystick.get_numhats()
+
+# Only print when something actually moved: axes as one NumPy snapshot
+# compared against the previous one, buttons as a single int bitmask so a
+# XOR shows every edge at once
+AXIS_CHANGE = 0.02
+prev_axes = np.zeros(num_axes, dtype=np.float32)
+prev_buttons = -1
+prev_hats = None
+
 while True:
     pygame.event.pump()
-    
-    print("\n--- AXES ---")
-    for i in range(joystick.get_numaxes()):
-        print(f"Axis {i}: {joystick.get_axis(i):.2f}")
-
-    print("--- BUTTONS ---")
-    for i in range(joystick.get_numbuttons()):
-        print(f"Button {i}: {joystick.get_button(i)}")
-
-    print("--- HATS (D-pad) ---")
-    for i in range(joystick.get_numhats()):
-        print(f"Hat {i}: {joystick.get_hat(i)}")
-    
-    time.sleep(0.3)
+
+    axes = np.fromiter((joystick.get_axis(i) for i in range(num_axes)),
+                       dtype=np.float32, count=num_axes)
+    buttons = sum(joystick.get_button(i) << i for i in range(num_buttons))
+    hats = tuple(joystick.get_hat(i) for i in range(num_hats))
+
+    if (np.any(np.abs(axes - prev_axes) > AXIS_CHANGE)
+            or buttons != prev_buttons or hats != prev_hats):
+        print("\n--- AXES ---")
+        print(np.array2string(axes, precision=2, suppress_small=True))
+
+        print("--- BUTTONS ---")
+        changed = buttons ^ (prev_buttons if prev_buttons >= 0 else 0)
+        print(f"mask: {buttons:#07x} changed: {changed:#07x}")
+
+        print("--- HATS (D-pad) ---")
+        for i, hat in enumerate(hats):
+            print(f"Hat {i}: {hat}")
+
+        prev_axes = axes
+        prev_buttons = buttons
+        prev_hats = hats
+
+    time.sleep(0.05)
@@ -1,20 +1,28 @@
-import os
 import pygame
 import time
 import signal
 import sys
 
-# Fix for headless environments (SSH, no GUI)
-os.environ["SDL_VIDEODRIVER"] = "dummy"
-
 class TestRemoteController:
     def __init__(self):
-        pygame.init()
+        # Joystick-only init; no video subsystem, so no dummy-driver hack
+        # and no window events entering the queue
         pygame.joystick.init()
         
+        # Queue only the event types the drain consumes; unconsumed types
+        # (axis motion) would otherwise fill the queue until SDL starts
+        # dropping events — including button edges
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED,
+                                  pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP])
+        
         self.joystick = None
         self.running = True
         
+        # Buttons currently held, maintained from JOYBUTTONDOWN/UP events
+        # instead of polling every button through SDL each tick
+        self._buttons_down = set()
+        
         # Control parameters
         self.deadzone = 0.1  # Ignore joystick values below this threshold
         self.max_linear_speed = 4.0  # Maximum linear speed in m/s
@@ -28,6 +36,12 @@ class TestRemoteController:
         self.connection_active = False
         self.emergency_stop_active = False
         
+        # Debug printing: telemetry is rate-limited, state changes print on
+        # edges only (each print is a GIL-serialized write syscall)
+        self.verbose = True
+        self._last_print_time = 0.0
+        self._turbo_was_active = False
+        
         # Control loop timing
         self.control_loop_rate = 0.1  # 100ms for testing
         
@@ -71,6 +85,7 @@ class TestRemoteController:
     def emergency_stop(self, reason):
         """Emergency stop (test version)"""
         print(f"EMERGENCY STOP: {reason}")
+        print("Emergency stop active - press Ctrl+C to quit")
         self.emergency_stop_active = True
     
     def process_joystick_input(self):
@@ -78,22 +93,27 @@ class TestRemoteController:
         if not self.joystick or not self.joystick.get_init():
             return 0.0, 0.0, False
         
-        # Handle pygame events for hotplug detection
-        for event in pygame.event.get():
-            if event.type == pygame.JOYDEVICEREMOVED:
+        # Handle hotplug and button events (get() pumps; the filter keeps
+        # SDL from building Python objects for anything we don't use)
+        for event in pygame.event.get([pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED,
+                                       pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP]):
+            if event.type == pygame.JOYBUTTONDOWN:
+                self._buttons_down.add(event.button)
+            elif event.type == pygame.JOYBUTTONUP:
+                self._buttons_down.discard(event.button)
+            elif event.type == pygame.JOYDEVICEREMOVED:
                 if hasattr(event, 'instance_id') and self.joystick and event.instance_id == self.joystick.get_instance_id():
                     print("Joystick removed via pygame event")
                     self.send_stop_command("Joystick removed")
                     self.joystick = None
                     self.connection_active = False
+                    self._buttons_down.clear()
                     return 0.0, 0.0, False
             elif event.type == pygame.JOYDEVICEADDED:
                 if not self.joystick:
                     print("New joystick detected via pygame event")
                     self.check_joystick_connection()
         
-        pygame.event.pump()
-        
         # Get joystick input
         # Left stick Y-axis for forward/backward (inverted)
         linear_input = -self.joystick.get_axis(1)
@@ -105,16 +125,17 @@ class TestRemoteController:
         angular_input = self.apply_deadzone(angular_input)
         
         # Check for emergency stop button (Button B - typically button 1)
-        if self.joystick.get_button(1):
+        if 1 in self._buttons_down:
             self.emergency_stop("Emergency stop button pressed")
             return 0.0, 0.0, False
         
         # Check for turbo mode (Right bumper - typically button 7)
-        turbo_active = self.joystick.get_button(7)
+        turbo_active = 7 in self._buttons_down
         current_multiplier = self.turbo_multiplier if turbo_active else self.speed_multiplier
         
-        if turbo_active:
+        if turbo_active and not self._turbo_was_active:
             print("TURBO MODE ACTIVE")
+        self._turbo_was_active = turbo_active
         
         # Calculate target velocities
         target_linear = linear_input * self.max_linear_speed * current_multiplier
@@ -125,15 +146,16 @@ class TestRemoteController:
         
         if has_input:
             self.last_activity_time = time.time()
-            print(f"Input: Linear={target_linear:.2f}, Angular={target_angular:.2f}")
         
-        # Debug: Show all button states
-        buttons_pressed = []
-        for i in range(self.joystick.get_numbuttons()):
-            if self.joystick.get_button(i):
-                buttons_pressed.append(i)
-        if buttons_pressed:
-            print(f"Buttons pressed: {buttons_pressed}")
+        # Debug telemetry, at most 4x/sec and stripped under python -O
+        if __debug__ and self.verbose and (has_input or self._buttons_down):
+            now = time.time()
+            if now - self._last_print_time > 0.25:
+                self._last_print_time = now
+                if has_input:
+                    print(f"Input: Linear={target_linear:.2f}, Angular={target_angular:.2f}")
+                if self._buttons_down:
+                    print(f"Buttons pressed: {sorted(self._buttons_down)}")
         
         return target_linear, target_angular, has_input
     
@@ -172,7 +194,6 @@ class TestRemoteController:
                 
                 # Skip control if emergency stop is active
                 if self.emergency_stop_active:
-                    print("Emergency stop active - press Ctrl+C to quit")
                     time.sleep(self.control_loop_rate)
                     continue
                 